@@ -0,0 +1,718 @@
+"""Aplikasi Tk Penjadwal Daya; strategi knapsack tahap tambahan dipilih di halaman input.
+
+Jalankan: python Optimalisasi.py [--solver dp|greedy|bnb|auto]
+"""
+import argparse
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, PhotoImage
+import ast
+from cache_jadwal import CacheSQLite
+from gambar import CacheAset, PerenderLatar
+from knapsack import SOLVER
+from penjadwal import PenjadwalDaya, PerhitunganDibatalkan, muat_tensor, input_terjemahan, hari_terjemahan, peta_terjemahan, peta_terjemahan_hari
+
+# Solver yang ditawarkan di UI (urutan tampil); "pareto" tidak ditawarkan karena pada data ini statusnya
+# hampir selalu melewati batas memori sehingga beralih ke "dp"
+PILIHAN_SOLVER = [nama for nama in ("dp", "greedy", "bnb") if nama in SOLVER] + ["auto"]
+
+
+class App(tk.Tk):
+    def __init__(self, solver="dp"):
+        super().__init__()
+        self.title("Penjadwal Daya")
+        self.geometry("1537x835")
+        self.frames = {}
+        self.shared_data = {}  # Untuk menyimpan data yang dibagikan antar halaman
+        self.solver = tk.StringVar(self, value=solver)  # Strategi tahap tambahan, bisa diganti di InputPage
+        self.perender_latar = PerenderLatar(self)  # Render latar bersama untuk semua halaman
+        self.aset = CacheAset(self)  # Gambar tombol bersama, di-decode sekali
+
+        # Pastikan frame merespons perubahan ukuran jendela
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        # Frame dibuat saat pertama kali ditampilkan (lihat show_frame)
+        self.page_classes = {F.__name__: F for F in (LoginPage, RegistrationPage, MainPage, InputPage, ResultPage, RulesPage, HitungPage)}
+
+        self.show_frame("LoginPage")  # Mulai dari halaman login
+
+    def show_frame(self, page_name):
+        frame = self.frames.get(page_name)
+        if frame is None:
+            frame = self.page_classes[page_name](parent=self, controller=self)
+            self.frames[page_name] = frame
+            frame.grid(row=0, column=0, sticky="nsew")  # Sesuaikan frame dengan jendela
+        frame.tkraise()
+
+
+class LoginPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+
+        self.bg_path = r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\bg_login.png"
+        self.bg_label = tk.Label(self)
+        self.bg_label.place(relwidth=1, relheight=1)
+
+        self.bind("<Configure>", self.resize_background)
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        # Input nama pengguna
+        def on_enter(e):
+            if user.get() == 'Username':
+                user.delete(0, 'end')
+
+        def on_leave(e):
+            if user.get() == '':
+                user.insert(0, 'Username')
+
+        user = tk.Entry(self, width=20, fg='#737373', border=0, bg='#FFBD59', font=('Poppins', 17))
+        user.place(x=1022, y=298)
+        user.insert(0, 'Username')
+        user.bind('<FocusIn>', on_enter)
+        user.bind('<FocusOut>', on_leave)
+
+        # Input kata sandi
+        def on_enter(e):
+            if code.get() == 'Password':
+                code.delete(0, 'end')
+                code.config(show="*")  # Sembunyikan teks dengan '*'
+
+        def on_leave(e):
+            if code.get() == '':
+                code.insert(0, 'Password')
+                code.config(show="")  # Tampilkan kembali teks placeholder
+
+        code = tk.Entry(self, width=20, fg='#737373', border=0, bg='#FFBD59', font=('Poppins', 17))
+        code.place(x=1022, y=384)
+        code.insert(0, 'Password')  # Teks placeholder awal
+        code.bind('<FocusIn>', on_enter)
+        code.bind('<FocusOut>', on_leave)
+
+        # Fungsi validasi login
+        def login():
+            username = user.get()
+            password = code.get()
+
+            try:
+                with open(r'C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\databest.txt', 'r') as file:
+                    data = file.read()
+                    users = ast.literal_eval(data) if data else {}
+                    
+                    if username in users and users[username]["password"] == password:
+                        messagebox.showinfo("Login", "Login berhasil")
+                        self.controller.show_frame("MainPage")
+                    else:
+                        messagebox.showerror("Login Gagal", "Username atau Password salah")
+            except FileNotFoundError:
+                messagebox.showerror("Error", "File databest.txt tidak ditemukan")
+            except Exception as e:
+                messagebox.showerror("Error", f"Terjadi kesalahan: {e}")
+
+        # Tombol Login
+        def create_image_button(parent, image_path, width, height, command):
+            """Helper untuk membuat tombol dengan gambar."""
+            img_photo = self.controller.aset.gambar(image_path, width, height)  # Diambil dari cache aset bersama
+            button = tk.Button(parent, image=img_photo, command=command, borderwidth=0)
+            button.image = img_photo  # Simpan referensi gambar agar tidak dihapus
+            return button
+
+        self.result_button = create_image_button(
+            self, image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_login.png", width=410, height=74, command=login
+        )
+        self.result_button.place(x=942, y=491)
+
+        # Teks dan tombol registrasi
+        label = tk.Label(self, text="Belum memiliki akun?", fg='#737373', bg='#E2F0F7', font=('Poppins', 12))
+        label.place(x=1025, y=575)
+
+        tk.Button(self, width=8, text='Registrasi', border=0, bg='#E2F0F7', cursor='hand2', fg='Red',font=('Poppins', 12), command=lambda: self.controller.show_frame("RegistrationPage")).place(x=1190, y=572)
+
+    def resize_background(self, event):
+        # Resize gambar sesuai ukuran jendela (debounce + cache lewat perender bersama)
+        self.controller.perender_latar.jadwalkan(self.bg_label, self.bg_path, (event.width, event.height))
+
+
+class RegistrationPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+
+        self.bg_path = r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\bg_register.png"
+        self.bg_label = tk.Label(self)
+        self.bg_label.place(relwidth=1, relheight=1)
+
+        self.bind("<Configure>", self.resize_background)
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        def registrasi():
+            namapengguna = user.get()
+            katakunci = code.get()
+            email = email_entry.get()
+
+            if not namapengguna or not katakunci or not email:
+                messagebox.showerror('Invalid', 'Semua bidang harus diisi')
+                return
+
+            try:
+                with open(r'C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\databest.txt', 'r+') as file:
+                    data = file.read()
+                    users = ast.literal_eval(data) if data else {}
+                    users[namapengguna] = {"password": katakunci, "email": email}
+                    file.seek(0)
+                    file.write(str(users))
+                    file.truncate()
+
+                messagebox.showinfo('Signup', 'Registrasi berhasil')
+                self.controller.show_frame("LoginPage")
+            except Exception as e:
+                messagebox.showerror("Error", f"Terjadi kesalahan: {e}")
+
+        # Entry Email
+        def on_enter(e):
+            if email_entry.get() == 'Email':
+                email_entry.delete(0, 'end')
+
+        def on_leave(e):
+            if email_entry.get() == '':
+                email_entry.insert(0, 'Email')
+
+        email_entry = tk.Entry(self, width=20, fg='#737373', border=0, bg='#FFBD59', font=('Poppins', 17))
+        email_entry.place(x=1022, y=210)
+        email_entry.insert(0, 'Email')
+        email_entry.bind('<FocusIn>', on_enter)
+        email_entry.bind('<FocusOut>', on_leave)
+
+        # Entry Username
+        def on_enter(e):
+            if user.get() == 'Username':
+                user.delete(0, 'end')
+
+        def on_leave(e):
+            if user.get() == '':
+                user.insert(0, 'Username')
+
+        user = tk.Entry(self, width=20, fg='#737373', border=0, bg='#FFBD59', font=('Poppins', 17))
+        user.place(x=1022, y=298)
+        user.insert(0, "Username")
+        user.bind('<FocusIn>', on_enter)
+        user.bind('<FocusOut>', on_leave)
+
+        # Entry Password
+        def on_enter(e):
+            if code.get() == 'Password':
+                code.delete(0, 'end')
+                code.config(show="*")  # Ubah karakter menjadi '*'
+
+        def on_leave(e):
+            if code.get() == '':
+                code.insert(0, 'Password')
+                code.config(show="")
+                
+        code = tk.Entry(self, width=20, fg='#737373', border=0, bg='#FFBD59', font=('Poppins', 17))
+        code.place(x=1022, y=384)
+        code.insert(0, 'Password')
+        code.bind('<FocusIn>', on_enter)
+        code.bind('<FocusOut>', on_leave)
+
+        # Tombol Registrasi
+        def create_image_button(parent, image_path, width, height, command):
+            """Helper untuk membuat tombol dengan gambar."""
+            img_photo = self.controller.aset.gambar(image_path, width, height)  # Diambil dari cache aset bersama
+            button = tk.Button(parent, image=img_photo, command=command, borderwidth=0)
+            button.image = img_photo  # Simpan referensi gambar agar tidak dihapus
+            return button
+        
+        self.result_button = create_image_button(
+            self, image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_signin.png", width=410, height=74, command=registrasi)
+        self.result_button.place(x=942, y=491)
+
+    def resize_background(self, event):
+        # Resize gambar sesuai ukuran jendela (debounce + cache lewat perender bersama)
+        self.controller.perender_latar.jadwalkan(self.bg_label, self.bg_path, (event.width, event.height))
+
+class MainPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+
+        # Simpan referensi gambar
+        self.bg_path = r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\bg_halaman utama.png"
+        self.bg_label = tk.Label(self)
+        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+
+        self.create_widgets()
+
+        # Bind event perubahan ukuran jendela
+        self.bind("<Configure>", self.resize_background)
+
+    def create_widgets(self):
+        def create_image_button(parent, image_path, width, height, command):
+            """Helper untuk membuat tombol dengan gambar."""
+            img_photo = self.controller.aset.gambar(image_path, width, height)  # Diambil dari cache aset bersama
+
+            # Buat tombol
+            button = tk.Button(parent, image=img_photo, command=command, borderwidth=0)
+            button.image = img_photo  # Simpan referensi gambar agar tidak dihapus
+            return button
+
+        self.button_labeladmin = create_image_button(self,image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_click.png",width=220,height=70, command=lambda: self.controller.show_frame("InputPage"))
+        self.button_labeladmin.place(x=657, y=591)
+
+        # Tombol Aturan Penggunaan
+        self.rules_button = create_image_button(self,image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_click.png",width=220,height=70, command=lambda: self.controller.show_frame("RulesPage"))
+        self.rules_button.place(x=311, y=591)
+
+        # Tombol Lihat Hasil
+        self.result_button = create_image_button(self,image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_click.png", width=220,height=70, command=lambda: self.controller.show_frame("HitungPage"))
+        self.result_button.place(x=1004, y=591)
+
+    def resize_background(self, event):
+        # Latar berukuran tetap; dirender sekali lalu diambil dari cache perender bersama
+        self.controller.perender_latar.jadwalkan(self.bg_label, self.bg_path, (1537, 835))
+
+class RulesPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+
+        # Simpan referensi gambar
+        self.bg_path = r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\bg_aturan.png"
+
+        # Label untuk gambar latar
+        self.bg_label = tk.Label(self)
+        self.bg_label.place(relwidth=1, relheight=1)
+
+        # Bind event resize
+        self.bind("<Configure>", self.resize_background)
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        def create_image_button(parent, image_path, width, height, command):
+            """Helper untuk membuat tombol dengan gambar."""
+            img_photo = self.controller.aset.gambar(image_path, width, height)  # Diambil dari cache aset bersama
+
+            # Buat tombol
+            button = tk.Button(parent, image=img_photo, command=command, borderwidth=0)
+            button.image = img_photo  # Simpan referensi gambar agar tidak dihapus
+            return button
+
+        self.back_button = create_image_button(self,image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_kembali.png",width=220,height=70, command=lambda: self.controller.show_frame("MainPage"))
+        self.back_button.place(x=1260, y= 40)
+
+
+    def resize_background(self, event):
+        # Latar berukuran tetap; dirender sekali lalu diambil dari cache perender bersama
+        self.controller.perender_latar.jadwalkan(self.bg_label, self.bg_path, (1537, 835))
+
+
+class InputPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+        # Simpan referensi gambar
+        self.bg_path = r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\bg_optimalan.png"
+
+        # Label untuk gambar latar
+        self.bg_label = tk.Label(self)
+        self.bg_label.place(relwidth=1, relheight=1)
+
+        # Bind event resize
+        self.bind("<Configure>", self.resize_background)
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        def create_image_button(parent, image_path, width, height, command):
+            """Helper untuk membuat tombol dengan gambar."""
+            img_photo = self.controller.aset.gambar(image_path, width, height)  # Diambil dari cache aset bersama
+
+            # Buat tombol
+            button = tk.Button(parent, image=img_photo, command=command, borderwidth=0)
+            button.image = img_photo  # Simpan referensi gambar agar tidak dihapus
+            return button
+
+        # Peralatan Prioritas
+        self.prioritas_peralatan = tk.Entry(self, width=28, font=("Arial", 20), bg ="#FFB300")
+        self.prioritas_peralatan.place(x=423,y=210)
+
+        # Jam Prioritas
+        self.prioritas_mulai = tk.Entry(self, width=28, font=("Arial", 20), bg ="#FFB300")
+        self.prioritas_mulai.place(x=423,y=283)
+
+        self.prioritas_selesai = tk.Entry(self, width=28, font=("Arial", 20), bg ="#FFB300")
+        self.prioritas_selesai.place(x=423,y=355)
+
+        # Peralatan Terjadwal
+        self.peralatan_terjadwal = tk.Entry(self, width=28, font=("Arial", 20), bg ="#FFB300")
+        self.peralatan_terjadwal.place(x=423,y= 429)
+
+        # Hari Terjadwal
+        self.hari_terjadwal = tk.Entry(self, width=28, font=("Arial", 20), bg ="#FFB300")
+        self.hari_terjadwal.place(x=423,y=500)
+
+        # Peralatan Tambahan
+        self.peralatan_tambahan = tk.Entry(self, width=28, font=("Arial", 20), bg ="#FFB300")
+        self.peralatan_tambahan.place(x=423,y=573)
+
+        # Anggaran Mingguan
+        self.anggaran_bulanan = tk.Entry(self, width=28, font=("Arial", 20), bg ="#FFB300")
+        self.anggaran_bulanan.place(x=423,y=645)
+
+        # Tombol Submit
+        self.submit_button = create_image_button(self,image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_submit.png", width=220,height=70, command=self.submit_data)
+        self.submit_button.place(x= 650, y=735)
+
+        # Pilihan solver tahap tambahan
+        tk.Label(self, text="Solver", font=("Arial", 16), bg="#FFB300").place(x=900, y=735)
+        self.pilihan_solver = ttk.Combobox(self, textvariable=self.controller.solver, values=PILIHAN_SOLVER,
+                                           state="readonly", width=10, font=("Arial", 16))
+        self.pilihan_solver.place(x=900, y=770)
+
+
+    def submit_data(self):
+        try:
+            # Simpan data ke shared_data
+            self.controller.shared_data["prioritas_peralatan"] = self.prioritas_peralatan.get()
+            self.controller.shared_data["prioritas_mulai"] = int(self.prioritas_mulai.get())
+            self.controller.shared_data["prioritas_selesai"] = int(self.prioritas_selesai.get())
+            self.controller.shared_data["peralatan_terjadwal"] = self.peralatan_terjadwal.get()
+            self.controller.shared_data["hari_terjadwal"] = self.hari_terjadwal.get()
+            self.controller.shared_data["peralatan_tambahan"] = self.peralatan_tambahan.get()
+            self.controller.shared_data["anggaran_bulanan"] = float(self.anggaran_bulanan.get())
+            self.controller.shared_data["solver"] = self.controller.solver.get()
+            
+            # Pindah ke halaman hasil
+            self.controller.show_frame("ResultPage")
+        except Exception as e:
+            messagebox.showerror("Error", f"Terjadi kesalahan: anda belum menginputkan apapun")
+
+    
+    def resize_background(self, event):
+        # Resize gambar sesuai ukuran jendela (debounce + cache lewat perender bersama)
+        self.controller.perender_latar.jadwalkan(self.bg_label, self.bg_path, (event.width, event.height))
+
+class ResultPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+
+        # Simpan referensi gambar
+        self.bg_path = r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\bg_hasil.png"
+        self.penjadwal = None
+        self.kunci_penjadwal = threading.Lock()
+        self.tugas = None  # Perhitungan yang sedang berjalan: {'batal': Event, 'antrian': Queue}
+
+        # Label untuk gambar latar
+        self.bg_label = tk.Label(self)
+        self.bg_label.place(relwidth=1, relheight=1)
+
+        # Bind event resize
+        self.bind("<Configure>", self.resize_background)
+
+        # Inisialisasi peringatan_label3
+        self.peringatan_label3 = None
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        def create_image_button(parent, image_path, width, height, command):
+            """Helper untuk membuat tombol dengan gambar."""
+            img_photo = self.controller.aset.gambar(image_path, width, height)  # Diambil dari cache aset bersama
+
+            # Buat tombol
+            button = tk.Button(parent, image=img_photo, command=command, borderwidth=0)
+            button.image = img_photo  # Simpan referensi gambar agar tidak dihapus
+            return button
+
+        # Area teks hasil
+        self.result_text = tk.Text(self, wrap="word", width=80, height=30, bg="#DCE9F0", border=0, borderwidth=0)
+        self.result_text.place(x=340, y=160, width=555, height=520)
+
+        # Label untuk total biaya
+        self.total_biaya_label = tk.Label(self, text="", font=("Arial", 18, "bold"), bg="#FFBD59", anchor="w")
+        self.total_biaya_label.place(x=1000, y=300, width=165, height=40)
+
+        # Label untuk peringatan
+        self.peringatan_label = tk.Label(self, text="", font=("Arial", 16), bg="#CAE0EC", anchor="w")
+        self.peringatan_label.place(x=1010, y=380, width=150, height=25)
+
+        self.peringatan_label2 = tk.Label(self, text="", font=("Arial", 16), bg="#CAE0EC", anchor="w")
+        self.peringatan_label2.place(x=945, y=410, width=300, height=25)
+
+        self.peringatan_label3 = tk.Label(self, text="", font=("Arial", 16), bg="#CAE0EC", anchor="w")
+        self.peringatan_label3.place(x=1005, y=440, width=165, height=25)
+
+        # Kemajuan perhitungan dan tombol batal (hanya tampil selama worker berjalan)
+        self.progress = ttk.Progressbar(self, mode="determinate", maximum=100)
+        self.cancel_button = tk.Button(self, text="Batal", font=("Arial", 14), command=self.batalkan)
+
+        # Tombol Kembali
+        self.back_button = create_image_button(
+            self, image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_kembali.png", width=220, height=70,
+            command=self.handle_back  # Panggil fungsi handle_back
+        )
+        self.back_button.place(x=1260, y=48)
+
+        # Tombol Home
+        self.home_button = create_image_button(
+            self, image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_home.png", width=220, height=70,
+            command=lambda: self.controller.show_frame("MainPage"),
+        )
+        self.home_button.place(x=124, y=48)
+
+    def handle_back(self):
+        """Fungsi untuk menangani tombol kembali."""
+        # Kosongkan teks label peringatan jika ada
+        if self.peringatan_label3:
+            self.peringatan_label3.config(text="")
+        # Berpindah ke frame "InputPage"
+        self.controller.show_frame("InputPage")
+
+
+    def tkraise(self, *args, **kwargs):
+        super().tkraise(*args, **kwargs)
+
+        # Ambil data dari shared_data (di thread Tk, sebelum worker dimulai)
+        try:
+            permintaan = dict(
+                peralatan_prioritas=input_terjemahan(self.controller.shared_data["prioritas_peralatan"], peta_terjemahan),
+                prioritas_mulai=self.controller.shared_data["prioritas_mulai"],
+                prioritas_selesai=self.controller.shared_data["prioritas_selesai"],
+                peralatan_terjadwal=input_terjemahan(self.controller.shared_data["peralatan_terjadwal"], peta_terjemahan),
+                hari_terjadwal=hari_terjemahan(self.controller.shared_data["hari_terjadwal"].split(', '), peta_terjemahan_hari),
+                peralatan_tambahan=input_terjemahan(self.controller.shared_data["peralatan_tambahan"], peta_terjemahan),
+                anggaran_bulanan=self.controller.shared_data["anggaran_bulanan"],
+                solver=self.controller.shared_data.get("solver", "dp"),
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Terjadi kesalahan saat memproses data: {e}")
+            return
+
+        # Batalkan perhitungan sebelumnya yang masih berjalan, lalu mulai worker baru
+        if self.tugas is not None:
+            self.tugas["batal"].set()
+        tugas = {"batal": threading.Event(), "antrian": queue.Queue()}
+        self.tugas = tugas
+
+        self.result_text.delete(1.0, tk.END)
+        self.total_biaya_label.config(text="")
+        self.peringatan_label.config(text="Menghitung...", fg="black")
+        self.peringatan_label2.config(text="")
+        self.peringatan_label3.config(text="")
+        self.progress["value"] = 0
+        self.progress.place(x=1000, y=480, width=250, height=20)
+        self.cancel_button.place(x=1075, y=510, width=100, height=35)
+
+        threading.Thread(target=self.jalankan_optimasi, args=(tugas, permintaan), daemon=True).start()
+        self.after(50, self.periksa_antrian, tugas)
+
+    def jalankan_optimasi(self, tugas, permintaan):
+        """Dijalankan di thread worker: tidak menyentuh widget, semua hasil dikirim lewat antrian."""
+        terakhir = [0.0]
+
+        def lapor(kemajuan):
+            if tugas["batal"].is_set():
+                raise PerhitunganDibatalkan()
+            # Kirim paling sering setiap kenaikan 1% agar antrian tidak membanjir
+            if kemajuan - terakhir[0] >= 0.01 or kemajuan >= 1.0:
+                terakhir[0] = kemajuan
+                tugas["antrian"].put(("kemajuan", kemajuan))
+
+        try:
+            # Satu perhitungan pada satu waktu; worker lama yang dibatalkan melepas kunci di laporan berikutnya
+            with self.kunci_penjadwal:
+                lapor(0.0)
+                # Tensor konsumsi cukup dibangun sekali, lalu dipakai ulang untuk setiap optimasi
+                if self.penjadwal is None:
+                    tensor = muat_tensor(r'C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\data bersih.csv')  # Load data (cache biner)
+                    self.penjadwal = PenjadwalDaya.dari_tensor(*tensor)
+                    self.penjadwal.cache_persisten = CacheSQLite(r'C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\cache jadwal.sqlite')
+
+                # Jalankan jadwal optimasi
+                jadwal_teroptimasi = self.penjadwal.optimalkan_jadwal(**permintaan, kemajuan=lapor)
+
+                # Format hasil dengan anggaran
+                hasil = self.penjadwal.format_jadwal(jadwal_teroptimasi, permintaan["anggaran_bulanan"])
+            tugas["antrian"].put(("selesai", jadwal_teroptimasi, hasil, permintaan["anggaran_bulanan"]))
+        except PerhitunganDibatalkan:
+            tugas["antrian"].put(("batal",))
+        except Exception as e:
+            tugas["antrian"].put(("error", e))
+
+    def periksa_antrian(self, tugas):
+        """Dipanggil berkala lewat after(): menerapkan pesan dari worker ke widget."""
+        if tugas is not self.tugas:
+            return  # Tugas lama yang sudah digantikan
+        try:
+            while True:
+                pesan = tugas["antrian"].get_nowait()
+                if pesan[0] == "kemajuan":
+                    self.progress["value"] = pesan[1] * 100
+                    continue
+
+                self.tugas = None
+                self.progress.place_forget()
+                self.cancel_button.place_forget()
+                if pesan[0] == "selesai":
+                    self.tampilkan_hasil(*pesan[1:])
+                elif pesan[0] == "batal":
+                    self.peringatan_label.config(text="DIBATALKAN", fg="red")
+                else:
+                    self.peringatan_label.config(text="")
+                    messagebox.showerror("Error", f"Terjadi kesalahan saat memproses data: {pesan[1]}")
+                return
+        except queue.Empty:
+            pass
+        self.after(50, self.periksa_antrian, tugas)
+
+    def batalkan(self):
+        """Meminta worker berhenti; worker berhenti di laporan kemajuan berikutnya."""
+        if self.tugas is not None:
+            self.tugas["batal"].set()
+            self.peringatan_label.config(text="Membatalkan...", fg="black")
+
+    def tampilkan_hasil(self, jadwal_teroptimasi, hasil, anggaran_bulanan):
+        # Bersihkan teks sebelumnya
+        self.result_text.delete(1.0, tk.END)
+
+        # Mengatur font, ukuran, dan warna
+        self.result_text.tag_configure("default", font=("Arial", 20), foreground="black")
+
+        # Tambahkan hasil dengan tag default
+        self.result_text.insert(tk.END, hasil, "default")
+
+        # Tampilkan total biaya dan peringatan
+        total_biaya = jadwal_teroptimasi['total_biaya']
+        self.total_biaya_label.config(text=f"Rp.{total_biaya:,.2f}")
+
+        if total_biaya > anggaran_bulanan:
+            kelebihan = total_biaya - anggaran_bulanan
+            self.peringatan_label.config(text=f"PERINGATAN:", fg="red")
+            self.peringatan_label2.config(text=f"Melebihii anggaran sebesar", fg="red")
+            self.peringatan_label3.config(text=f"Rp. {kelebihan:,.2f}.", fg="red")
+        else:
+            self.peringatan_label.config(text=f"AMANNNNNNN", fg="green")
+            self.peringatan_label2.config(text="Biaya listrik dalam anggaran.", fg="green")
+
+    def resize_background(self, event):
+        # Resize gambar sesuai ukuran jendela (debounce + cache lewat perender bersama)
+        self.controller.perender_latar.jadwalkan(self.bg_label, self.bg_path, (event.width, event.height))
+
+
+class HitungPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+
+        # Simpan referensi gambar latar belakang
+        self.bg_path = r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\bg_hitung.png"
+        self.bg_label = tk.Label(self)
+        self.bg_label.place(relwidth=1, relheight=1)
+
+        # Bind event resize
+        self.bind("<Configure>", self.resize_background)
+
+        # Elemen UI
+        self.create_widgets()
+
+    def create_widgets(self):
+        def create_image_button(parent, image_path, width, height, command):
+            """Helper untuk membuat tombol dengan gambar."""
+            img_photo = self.controller.aset.gambar(image_path, width, height)  # Diambil dari cache aset bersama
+            button = tk.Button(parent, image=img_photo, command=command, borderwidth=0)
+            button.image = img_photo  # Simpan referensi gambar agar tidak dihapus
+            return button
+
+        # Label dan Entry untuk input
+        self.entry_daya = tk.Entry(self, font=("Poppins", 20), width=23, bg="#FFB300")
+        self.entry_daya.place(x=503, y=200)
+
+        self.entry_harga = tk.Entry(self, font=("Poppins", 20), width=23, bg="#FFB300")
+        self.entry_harga.place(x=503, y=272)
+
+        self.entry_durasi = tk.Entry(self, font=("Poppins", 20), width=23, bg="#FFB300")
+        self.entry_durasi.place(x=503, y=346)
+        # Tabel hasil
+        columns = ("Waktu", "Konsumsi (kWh)", "Biaya (Rp)")
+        self.table = ttk.Treeview(self, columns=columns, show="headings", height=5)
+        style = ttk.Style()
+        style.theme_use("default")
+        style.configure("Treeview.Heading", font=("Poppins", 20, "bold"), foreground='#384766')
+        style.configure("Treeview", font=("Poppins", 16), foreground="#384766", rowheight=33, background="#FFB300")
+        style.map("Treeview", background=[("selected", "#384766")], foreground=[("selected", "black")])
+        self.table.heading("Waktu", text="Waktu",)
+        self.table.heading("Konsumsi (kWh)", text="Konsumsi (kWh)")
+        self.table.heading("Biaya (Rp)", text="Biaya (Rp)")
+        self.table.place(x=130, y=500, width=750, height=170)
+
+        for _ in range(5):  # 5 baris kosong
+            self.table.insert("", "end", values=("", "", ""))
+
+        # Tombol Hitung
+        self.calculate_button = create_image_button(
+            self, image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_hitung.png", width=220, height=70, command=self.hitung_konsumsi_listrik
+        )
+        self.calculate_button.place(x=390, y=405)
+
+        # Tombol Kembali ke Halaman Utama
+        self.back_button = create_image_button(
+            self, image_path=r"C:\Users\Muhammad Zaky T A\Downloads\Projek DAA\tbl_kembali.png", width=220, height=70, command=lambda: self.controller.show_frame("MainPage")
+        )
+        self.back_button.place(x=1260, y=48)
+
+    def hitung_konsumsi_listrik(self):
+        try:
+            # Ambil input dari entri
+            daya = float(self.entry_daya.get())
+            harga_per_kwh = float(self.entry_harga.get())
+            durasi_per_hari = float(self.entry_durasi.get())
+
+            # Konversi watt ke kWh
+            konsumsi_per_jam_kwh = daya / 1000  # 1 kWh = 1000 watt
+
+            # Perhitungan konsumsi dan biaya
+            konsumsi_per_hari_kwh = konsumsi_per_jam_kwh * durasi_per_hari
+            konsumsi_per_bulan_kwh = konsumsi_per_hari_kwh * 30
+            konsumsi_per_tahun_kwh = konsumsi_per_hari_kwh * 365
+
+            biaya_per_jam = konsumsi_per_jam_kwh * harga_per_kwh
+            biaya_per_hari = konsumsi_per_hari_kwh * harga_per_kwh
+            biaya_per_bulan = konsumsi_per_bulan_kwh * harga_per_kwh
+            biaya_per_tahun = konsumsi_per_tahun_kwh * harga_per_kwh
+
+            # Hapus data lama di tabel
+            for row in self.table.get_children():
+                self.table.delete(row)
+
+            # Tambahkan hasil perhitungan ke tabel
+            self.table.insert("", "end", values=("Per Jam", f"{konsumsi_per_jam_kwh:.2f} kWh", f"Rp {biaya_per_jam:,.2f}"))
+            self.table.insert("", "end", values=("Per Hari", f"{konsumsi_per_hari_kwh:.2f} kWh", f"Rp {biaya_per_hari:,.2f}"))
+            self.table.insert("", "end", values=("Per Bulan", f"{konsumsi_per_bulan_kwh:.2f} kWh", f"Rp {biaya_per_bulan:,.2f}"))
+            self.table.insert("", "end", values=("Per Tahun", f"{konsumsi_per_tahun_kwh:.2f} kWh", f"Rp {biaya_per_tahun:,.2f}"))
+        except ValueError:
+            messagebox.showerror("Input Error", "Harap masukkan angka yang valid!")
+
+    def resize_background(self, event):
+        # Resize gambar sesuai ukuran jendela (debounce + cache lewat perender bersama)
+        self.controller.perender_latar.jadwalkan(self.bg_label, self.bg_path, (event.width, event.height))
+
+
+def main(solver="dp"):
+    app = App(solver)
+    app.mainloop()
+
+
+# Jalankan Aplikasi
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aplikasi Penjadwal Daya.")
+    parser.add_argument("--solver", choices=PILIHAN_SOLVER, default="dp", help="Solver awal tahap tambahan.")
+    main(parser.parse_args().solver)
+
@@ -0,0 +1,186 @@
+"""Cache hasil jadwal untuk PenjadwalDaya: LRU di memori dan penyimpanan SQLite di disk."""
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class CacheLRU:
+    """Cache LRU berbatas untuk hasil `optimalkan_jadwal`, dibatasi jumlah entri dan perkiraan byte.
+
+    Ukuran entri diperkirakan dari panjang pickle hasilnya. Hasil yang dikembalikan dibagikan
+    antar pemanggil, jadi jangan diubah.
+    """
+
+    def __init__(self, maks_entri: int = 256, maks_byte: int = 64 * 1024 * 1024):
+        self.maks_entri = maks_entri
+        self.maks_byte = maks_byte
+        self.data: 'OrderedDict[Hashable, Dict]' = OrderedDict()
+        self.ukuran: Dict[Hashable, int] = {}
+        self.total_byte = 0
+        self.hit = 0
+        self.miss = 0
+        self.eviksi = 0
+        self.kunci = threading.Lock()
+
+    def ambil(self, kunci: Hashable) -> Optional[Dict]:
+        """Mengambil hasil untuk `kunci` dan menandainya paling baru dipakai; None jika tidak ada."""
+        with self.kunci:
+            hasil = self.data.get(kunci)
+            if hasil is None:
+                self.miss += 1
+                return None
+            self.data.move_to_end(kunci)
+            self.hit += 1
+            return hasil
+
+    def simpan(self, kunci: Hashable, hasil: Dict) -> None:
+        """Menyimpan hasil lalu membuang entri paling lama hingga batas entri dan byte terpenuhi."""
+        ukuran = len(pickle.dumps(hasil, protocol=pickle.HIGHEST_PROTOCOL))
+        if ukuran > self.maks_byte:
+            return
+        with self.kunci:
+            if kunci in self.data:
+                self.total_byte -= self.ukuran.pop(kunci)
+                del self.data[kunci]
+            self.data[kunci] = hasil
+            self.ukuran[kunci] = ukuran
+            self.total_byte += ukuran
+            while len(self.data) > self.maks_entri or self.total_byte > self.maks_byte:
+                kunci_lama, _ = self.data.popitem(last=False)
+                self.total_byte -= self.ukuran.pop(kunci_lama)
+                self.eviksi += 1
+
+    def kosongkan(self) -> None:
+        """Menghapus semua entri; penghitung statistik tidak direset."""
+        with self.kunci:
+            self.data.clear()
+            self.ukuran.clear()
+            self.total_byte = 0
+
+    def statistik(self) -> Dict[str, int]:
+        """Mengembalikan penghitung hit/miss/eviksi serta jumlah entri dan byte saat ini."""
+        with self.kunci:
+            return {
+                'hit': self.hit,
+                'miss': self.miss,
+                'eviksi': self.eviksi,
+                'entri': len(self.data),
+                'byte': self.total_byte,
+            }
+
+
+class CacheSQLite:
+    """Penyimpanan hasil jadwal di file SQLite agar tetap ada setelah aplikasi dimulai ulang.
+
+    Kunci disimpan sebagai hash SHA-256 dari `repr(kunci)` bersama sidik dataset. Entri lebih tua
+    dari `maks_umur` detik dianggap kedaluwarsa; bila total ukuran melewati `maks_byte`, entri yang
+    paling lama tidak dipakai dibuang. Setiap operasi membuka koneksi sendiri dengan mode WAL;
+    penulisan memakai `BEGIN IMMEDIATE`, sedangkan pembacaan memakai transaksi deferred sehingga
+    pembaca tidak saling mengantre, jadi aman dipakai beberapa proses sekaligus.
+
+    Cache tidak pernah menggagalkan perhitungan: galat SQLite (kunci tertahan lebih lama dari
+    `batas_tunggu`, path yang tidak bisa ditulis, file rusak) dihitung di `galat` lalu diperlakukan
+    sebagai miss atau penulisan yang dilewati.
+    """
+
+    def __init__(self, path: str, maks_byte: int = 256 * 1024 * 1024, maks_umur: float = 30 * 24 * 3600,
+                 batas_tunggu: float = 10.0):
+        self.path = path
+        self.maks_byte = maks_byte
+        self.maks_umur = maks_umur
+        self.batas_tunggu = batas_tunggu
+        self.galat = 0
+        try:
+            kon = self.koneksi()
+            try:
+                kon.execute("PRAGMA journal_mode=WAL")
+                kon.execute(
+                    "CREATE TABLE IF NOT EXISTS hasil ("
+                    "kunci TEXT PRIMARY KEY, sidik TEXT NOT NULL, data BLOB NOT NULL, "
+                    "ukuran INTEGER NOT NULL, dibuat REAL NOT NULL, dipakai REAL NOT NULL)"
+                )
+                kon.execute("CREATE INDEX IF NOT EXISTS hasil_dipakai ON hasil (dipakai)")
+            finally:
+                kon.close()
+        except sqlite3.Error:
+            self.galat += 1
+
+    def koneksi(self) -> sqlite3.Connection:
+        """Membuka koneksi baru; transaksi diatur manual (isolation_level=None)."""
+        return sqlite3.connect(self.path, timeout=self.batas_tunggu, isolation_level=None)
+
+    @staticmethod
+    def hash_kunci(kunci: Hashable) -> str:
+        """Mengubah kunci permintaan (tuple nilai sederhana) menjadi hash yang stabil antar proses."""
+        return hashlib.sha256(repr(kunci).encode()).hexdigest()
+
+    def ambil(self, kunci: Hashable, sidik: str) -> Optional[Dict]:
+        """Mengambil hasil yang belum kedaluwarsa untuk `kunci` pada dataset `sidik`; None jika tidak ada.
+
+        Waktu 'dipakai' (urutan eviksi) diperbarui tanpa menunggu; bila database sedang dikunci
+        penulis lain, pembaruan itu dilewati.
+        """
+        sekarang = time.time()
+        try:
+            kon = self.koneksi()
+            try:
+                baris = kon.execute(
+                    "SELECT data FROM hasil WHERE kunci = ? AND sidik = ? AND dibuat >= ?",
+                    (self.hash_kunci(kunci), sidik, sekarang - self.maks_umur),
+                ).fetchone()
+                if baris is not None:
+                    try:
+                        kon.execute("PRAGMA busy_timeout = 0")
+                        kon.execute("UPDATE hasil SET dipakai = ? WHERE kunci = ?", (sekarang, self.hash_kunci(kunci)))
+                    except sqlite3.OperationalError:
+                        pass
+            finally:
+                kon.close()
+        except sqlite3.Error:
+            self.galat += 1
+            return None
+        return None if baris is None else pickle.loads(baris[0])
+
+    def simpan(self, kunci: Hashable, sidik: str, hasil: Dict) -> None:
+        """Menyimpan hasil lalu membuang entri kedaluwarsa dan entri lama hingga di bawah `maks_byte`.
+
+        Bila database tidak bisa dikunci atau ditulis, penyimpanan dilewati.
+        """
+        data = pickle.dumps(hasil, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.maks_byte:
+            return
+        sekarang = time.time()
+        try:
+            kon = self.koneksi()
+            try:
+                kon.execute("BEGIN IMMEDIATE")
+                kon.execute(
+                    "INSERT OR REPLACE INTO hasil (kunci, sidik, data, ukuran, dibuat, dipakai) VALUES (?, ?, ?, ?, ?, ?)",
+                    (self.hash_kunci(kunci), sidik, data, len(data), sekarang, sekarang),
+                )
+                kon.execute("DELETE FROM hasil WHERE dibuat < ?", (sekarang - self.maks_umur,))
+                total = kon.execute("SELECT COALESCE(SUM(ukuran), 0) FROM hasil").fetchone()[0]
+                if total > self.maks_byte:
+                    terbuang = 0
+                    for kunci_lama, ukuran in kon.execute("SELECT kunci, ukuran FROM hasil ORDER BY dipakai").fetchall():
+                        if total - terbuang <= self.maks_byte:
+                            break
+                        kon.execute("DELETE FROM hasil WHERE kunci = ?", (kunci_lama,))
+                        terbuang += ukuran
+                kon.execute("COMMIT")
+            finally:
+                kon.close()  # Transaksi yang belum di-COMMIT dibatalkan saat koneksi ditutup
+        except sqlite3.Error:
+            self.galat += 1
+
+    def kosongkan(self) -> None:
+        """Menghapus semua entri di file cache."""
+        kon = self.koneksi()
+        try:
+            kon.execute("DELETE FROM hasil")
+        finally:
+            kon.close()
@@ -0,0 +1,82 @@
+"""Mode baris perintah tanpa antarmuka grafis untuk PenjadwalDaya.
+
+Contoh (dari folder ini):
+    python -m cli optimize --input permintaan.json
+    python -m cli optimize --input batch.json --output hasil.json --worker 4
+
+Berkas input berisi satu objek permintaan atau daftar permintaan; kuncinya adalah nama argumen
+`optimalkan_jadwal`. Hanya inti penjadwal yang dimuat (tanpa tkinter/PIL); pandas hanya dimuat
+bila cache biner dataset perlu dibangun ulang.
+"""
+import argparse
+import contextlib
+import json
+import sys
+from typing import Dict, List, Optional
+
+
+def baca_permintaan(path: str) -> List[Dict]:
+    """Membaca file JSON berisi satu permintaan atau daftar permintaan ('-' untuk stdin)."""
+    if path == '-':
+        data = json.load(sys.stdin)
+    else:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    return data if isinstance(data, list) else [data]
+
+
+def jalankan_optimalkan(args: argparse.Namespace) -> int:
+    """Menjalankan subperintah `optimize`: menyelesaikan semua permintaan lalu menulis hasilnya."""
+    from penjadwal import PATH_DATA, muat_penjadwal, optimalkan_banyak_paralel
+
+    daftar_permintaan = baca_permintaan(args.input)
+    path_data = args.data or PATH_DATA
+    # Cetakan waktu eksekusi dialihkan ke stderr agar stdout hanya berisi hasil
+    with contextlib.redirect_stdout(sys.stderr):
+        penjadwal = muat_penjadwal(path_data, args.tarif, args.cache)
+        if args.worker and args.worker > 1 and len(daftar_permintaan) > 1:
+            daftar_hasil = list(optimalkan_banyak_paralel(daftar_permintaan, path_data, args.tarif,
+                                                          args.worker, args.chunk))
+        elif len(daftar_permintaan) > 1:
+            daftar_hasil = penjadwal.optimalkan_banyak(daftar_permintaan)
+        else:
+            daftar_hasil = [penjadwal.optimalkan_jadwal(**daftar_permintaan[0])]
+
+    if args.format == 'teks':
+        keluaran = "\n\n".join(
+            penjadwal.format_jadwal(hasil, permintaan['anggaran_bulanan'])
+            + f"\nTotal Biaya: Rp {hasil['total_biaya']:,.2f}"
+            for permintaan, hasil in zip(daftar_permintaan, daftar_hasil)
+        ) + "\n"
+    else:
+        keluaran = json.dumps(daftar_hasil if len(daftar_hasil) > 1 else daftar_hasil[0], indent=2) + "\n"
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(keluaran)
+    else:
+        sys.stdout.write(keluaran)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m cli', description="Optimasi jadwal daya tanpa GUI.")
+    subparser = parser.add_subparsers(dest='perintah', required=True)
+
+    optimalkan = subparser.add_parser('optimize', aliases=['optimalkan'], help="Menyusun jadwal dari file permintaan JSON.")
+    optimalkan.add_argument('--input', '-i', required=True, help="File JSON permintaan ('-' untuk stdin).")
+    optimalkan.add_argument('--output', '-o', help="File keluaran (bawaan: stdout).")
+    optimalkan.add_argument('--format', choices=['json', 'teks'], default='json', help="Format keluaran.")
+    optimalkan.add_argument('--data', help="Path CSV dataset konsumsi (bawaan: data bersih.csv di folder ini).")
+    optimalkan.add_argument('--tarif', type=float, default=1400, help="Harga per kWh (Rp).")
+    optimalkan.add_argument('--cache', help="File SQLite untuk cache hasil persisten.")
+    optimalkan.add_argument('--worker', type=int, default=1, help="Jumlah proses worker untuk batch.")
+    optimalkan.add_argument('--chunk', type=int, default=64, help="Jumlah permintaan per chunk worker.")
+    optimalkan.set_defaults(fungsi=jalankan_optimalkan)
+
+    args = parser.parse_args(argv)
+    return args.fungsi(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Layanan gambar bersama untuk halaman Tk: render latar belakang dengan debounce dan cache ukuran."""
+import tkinter as tk
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from PIL import Image, ImageTk
+
+
+class PerenderLatar:
+    """Merender ulang gambar latar saat jendela diubah ukurannya tanpa membuat UI tersendat.
+
+    Selama jendela ditarik, render cepat (BILINEAR) dijalankan paling sering sekali per `jeda_cepat` ms
+    dengan ukuran terbaru. Setelah tidak ada event selama `jeda_akhir` ms, satu render LANCZOS dibuat
+    dan disimpan di cache menurut (path, ukuran), sehingga ukuran yang pernah dipakai langsung tampil.
+    Gambar sumber dibuka sekali per path dan dibagikan antar halaman.
+    """
+
+    def __init__(self, root: tk.Misc, jeda_cepat: int = 40, jeda_akhir: int = 200, maks_cache: int = 32):
+        self.root = root
+        self.jeda_cepat = jeda_cepat
+        self.jeda_akhir = jeda_akhir
+        self.maks_cache = maks_cache
+        self.sumber: Dict[str, Image.Image] = {}
+        self.cache: 'OrderedDict[Tuple[str, int, int], ImageTk.PhotoImage]' = OrderedDict()
+        self.tertunda: Dict[tk.Label, Dict] = {}
+
+    def gambar_sumber(self, path: str) -> Image.Image:
+        """Membuka dan men-decode gambar sumber sekali per path."""
+        if path not in self.sumber:
+            gambar = Image.open(path)
+            gambar.load()
+            self.sumber[path] = gambar
+        return self.sumber[path]
+
+    def render_akhir(self, path: str, ukuran: Tuple[int, int]) -> ImageTk.PhotoImage:
+        """Render LANCZOS dengan cache LRU per (path, lebar, tinggi)."""
+        kunci = (path, *ukuran)
+        if kunci in self.cache:
+            self.cache.move_to_end(kunci)
+            return self.cache[kunci]
+        foto = ImageTk.PhotoImage(self.gambar_sumber(path).resize(ukuran, Image.Resampling.LANCZOS), master=self.root)
+        self.cache[kunci] = foto
+        if len(self.cache) > self.maks_cache:
+            self.cache.popitem(last=False)
+        return foto
+
+    def render_cepat(self, path: str, ukuran: Tuple[int, int]) -> ImageTk.PhotoImage:
+        """Render sementara dengan filter cepat selama jendela masih ditarik (tidak di-cache)."""
+        gambar = self.gambar_sumber(path).resize(ukuran, Image.Resampling.BILINEAR, reducing_gap=2.0)
+        return ImageTk.PhotoImage(gambar, master=self.root)
+
+    @staticmethod
+    def tampilkan(label: tk.Label, foto: ImageTk.PhotoImage) -> None:
+        label.config(image=foto)
+        label.image = foto  # Simpan referensi agar gambar tidak dihapus walau keluar dari cache
+
+    def jadwalkan(self, label: tk.Label, path: str, ukuran: Tuple[int, int]) -> None:
+        """Dipanggil dari handler `<Configure>`: menampilkan latar `path` berukuran `ukuran` pada `label`."""
+        lebar, tinggi = ukuran
+        if lebar < 2 or tinggi < 2:
+            return
+        status = self.tertunda.setdefault(label, {'cepat': None, 'akhir': None})
+        if status['akhir'] is not None:
+            self.root.after_cancel(status['akhir'])
+            status['akhir'] = None
+        status['path'], status['ukuran'] = path, (lebar, tinggi)
+
+        if (path, lebar, tinggi) in self.cache:
+            if status['cepat'] is not None:
+                self.root.after_cancel(status['cepat'])
+                status['cepat'] = None
+            self.tampilkan(label, self.render_akhir(path, (lebar, tinggi)))
+            return
+
+        if status['cepat'] is None:
+            status['cepat'] = self.root.after(self.jeda_cepat, lambda: self.jalankan_cepat(label))
+        status['akhir'] = self.root.after(self.jeda_akhir, lambda: self.jalankan_akhir(label))
+
+    def jalankan_cepat(self, label: tk.Label) -> None:
+        status = self.tertunda[label]
+        status['cepat'] = None
+        if status['akhir'] is not None and label.winfo_exists():
+            self.tampilkan(label, self.render_cepat(status['path'], status['ukuran']))
+
+    def jalankan_akhir(self, label: tk.Label) -> None:
+        status = self.tertunda[label]
+        status['akhir'] = None
+        if label.winfo_exists():
+            self.tampilkan(label, self.render_akhir(status['path'], status['ukuran']))
+
+
+
+class CacheAset:
+    """Cache gambar tombol (`tbl_*.png`) bersama: setiap (path, lebar, tinggi) di-decode dan diskalakan sekali."""
+
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        self.foto: Dict[Tuple[str, int, int], ImageTk.PhotoImage] = {}
+
+    def gambar(self, path: str, lebar: int, tinggi: int) -> ImageTk.PhotoImage:
+        kunci = (path, lebar, tinggi)
+        if kunci not in self.foto:
+            with Image.open(path) as gambar:
+                self.foto[kunci] = ImageTk.PhotoImage(gambar.resize((lebar, tinggi), Image.Resampling.LANCZOS),
+                                                      master=self.root)
+        return self.foto[kunci]
@@ -0,0 +1,97 @@
+"""Ingesti bertahap pembacaan meter mentah menjadi profil rata-rata (peralatan, hari, jam)."""
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class AgregatorProfil:
+    """Menyimpan jumlah dan cacah berjalan per (peralatan, hari dalam minggu, jam).
+
+    Setiap baris mentah adalah satu pembacaan kWh per jam dengan timestamp. Data dibaca per chunk
+    sehingga memori tidak bergantung pada panjang riwayat, dan state bisa disimpan lalu dilanjutkan
+    dengan data baru tanpa memproses ulang data lama.
+    """
+
+    def __init__(self):
+        self.peralatan: List[str] = []
+        self.kode_peralatan = {}
+        self.jumlah = np.zeros((0, 7, 24), dtype=np.float64)
+        self.cacah = np.zeros((0, 7, 24), dtype=np.int64)
+
+    def kode_untuk(self, peralatan: np.ndarray) -> np.ndarray:
+        """Mengubah nama peralatan menjadi kode, menambah baris state untuk peralatan baru."""
+        baru = [alat for alat in pd.unique(peralatan) if alat not in self.kode_peralatan]
+        if baru:
+            for alat in baru:
+                self.kode_peralatan[alat] = len(self.peralatan)
+                self.peralatan.append(alat)
+            self.jumlah = np.concatenate([self.jumlah, np.zeros((len(baru), 7, 24), dtype=np.float64)])
+            self.cacah = np.concatenate([self.cacah, np.zeros((len(baru), 7, 24), dtype=np.int64)])
+        return pd.Categorical(peralatan, categories=self.peralatan).codes
+
+    def tambah(self, peralatan: Iterable[str], waktu: Iterable, kwh: Iterable[float]) -> int:
+        """Menambahkan satu chunk pembacaan; baris dengan waktu atau kWh tidak valid dilewati.
+
+        Mengembalikan jumlah baris yang dipakai.
+        """
+        waktu = pd.to_datetime(pd.Series(waktu), errors='coerce')
+        kwh = pd.to_numeric(pd.Series(kwh), errors='coerce').to_numpy(dtype=np.float64)
+        peralatan = pd.Series(peralatan).astype(str).to_numpy()
+        valid = waktu.notna().to_numpy() & np.isfinite(kwh)
+        if not valid.any():
+            return 0
+
+        kode_alat = self.kode_untuk(peralatan[valid])
+        kode_hari = waktu.dt.dayofweek.to_numpy()[valid].astype(np.intp)
+        kode_jam = waktu.dt.hour.to_numpy()[valid].astype(np.intp)
+        indeks = (kode_alat, kode_hari, kode_jam)
+        np.add.at(self.jumlah, indeks, kwh[valid])
+        np.add.at(self.cacah, indeks, 1)
+        return int(valid.sum())
+
+    def baca_csv(self, path: str, ukuran_chunk: int = 100_000, kolom_alat: str = 'appliance',
+                 kolom_waktu: str = 'timestamp', kolom_kwh: str = 'energy_consumption_kWh') -> int:
+        """Membaca CSV pembacaan mentah per chunk `ukuran_chunk` baris; mengembalikan jumlah baris terpakai."""
+        total = 0
+        for chunk in pd.read_csv(path, chunksize=ukuran_chunk, usecols=[kolom_alat, kolom_waktu, kolom_kwh]):
+            total += self.tambah(chunk[kolom_alat], chunk[kolom_waktu], chunk[kolom_kwh])
+        return total
+
+    def baca_jsonl(self, path: str, ukuran_chunk: int = 100_000, kolom_alat: str = 'appliance',
+                   kolom_waktu: str = 'timestamp', kolom_kwh: str = 'energy_consumption_kWh') -> int:
+        """Membaca JSONL (satu objek pembacaan per baris) per chunk; mengembalikan jumlah baris terpakai."""
+        total = 0
+        for chunk in pd.read_json(path, lines=True, chunksize=ukuran_chunk, dtype=False, convert_dates=False):
+            total += self.tambah(chunk[kolom_alat], chunk[kolom_waktu], chunk[kolom_kwh])
+        return total
+
+    def tensor(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Menghasilkan (peralatan, konsumsi rata-rata, tersedia) seperti `bangun_tensor_konsumsi`.
+
+        Peralatan diurutkan menurut nama agar kodenya sama dengan yang dibangun dari CSV.
+        """
+        urutan = sorted(range(len(self.peralatan)), key=lambda i: self.peralatan[i])
+        jumlah, cacah = self.jumlah[urutan], self.cacah[urutan]
+        tersedia = cacah > 0
+        konsumsi = np.divide(jumlah, cacah, out=np.zeros(jumlah.shape, dtype=np.float64), where=tersedia)
+        return [self.peralatan[i] for i in urutan], konsumsi, tersedia
+
+    def simpan(self, path: str) -> None:
+        """Menyimpan state berjalan ke `.npz` agar ingesti bisa dilanjutkan kemudian."""
+        np.savez(path, peralatan=np.array(self.peralatan, dtype=str), jumlah=self.jumlah, cacah=self.cacah)
+
+    @classmethod
+    def muat(cls, path: str, boleh_kosong: bool = True) -> 'AgregatorProfil':
+        """Memuat state dari `.npz`; bila file belum ada dan `boleh_kosong`, mulai dari state kosong."""
+        agregator = cls()
+        try:
+            with np.load(path, allow_pickle=False) as arsip:
+                agregator.peralatan = arsip['peralatan'].tolist()
+                agregator.jumlah = arsip['jumlah']
+                agregator.cacah = arsip['cacah']
+        except FileNotFoundError:
+            if not boleh_kosong:
+                raise
+        agregator.kode_peralatan = {alat: i for i, alat in enumerate(agregator.peralatan)}
+        return agregator
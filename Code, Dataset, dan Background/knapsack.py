@@ -0,0 +1,814 @@
+"""Mesin knapsack 0/1 untuk tahap penggunaan tambahan PenjadwalDaya."""
+import math
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Callback kemajuan: dipanggil dengan pecahan 0..1; boleh melempar PerhitunganDibatalkan untuk berhenti
+Kemajuan = Callable[[float], None]
+
+
+class PerhitunganDibatalkan(Exception):
+    """Dilempar oleh callback kemajuan untuk menghentikan solver yang sedang berjalan."""
+
+
+def isi_dp(bobot: np.ndarray, nilai: np.ndarray, kapasitas: int,
+           kemajuan: Optional[Kemajuan] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Mengisi DP knapsack 0/1 dengan satu baris bergulir (NumPy) dan matriks pilihan bit-packed.
+
+    `bobot` berupa bilangan bulat dalam satuan kapasitas. Memori yang dipakai
+    O(n * kapasitas / 8) byte, bukan O(n * kapasitas) objek Python.
+    Mengembalikan (baris, pilihan): baris[b] adalah nilai terbaik untuk setiap kapasitas b.
+    `kemajuan` dipanggil setelah setiap item.
+    """
+    bobot = np.asarray(bobot, dtype=np.int64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    n = len(bobot)
+    kapasitas = int(kapasitas)
+
+    baris = np.zeros(kapasitas + 1, dtype=np.float64)
+    pilihan = np.zeros((n, (kapasitas + 8) // 8), dtype=np.uint8)
+    ambil = np.zeros(kapasitas + 1, dtype=bool)
+
+    # Isi baris DP item demi item; `calon` dihitung dari baris lama sebelum ditimpa
+    for i in range(n):
+        w = max(int(bobot[i]), 0)
+        if w <= kapasitas:
+            calon = baris[:kapasitas + 1 - w] + nilai[i]
+            ambil[:] = False
+            ambil[w:] = calon > baris[w:]
+            np.copyto(baris[w:], calon, where=ambil[w:])
+            pilihan[i] = np.packbits(ambil)
+        if kemajuan is not None:
+            kemajuan((i + 1) / n)
+    return baris, pilihan
+
+
+def lacak_balik(pilihan: np.ndarray, bobot: np.ndarray, kapasitas: int) -> np.ndarray:
+    """Backtrack dari bit pilihan untuk kapasitas mana pun <= kapasitas saat pengisian."""
+    terpilih = []
+    b = int(kapasitas)
+    for i in range(len(pilihan) - 1, -1, -1):
+        if (pilihan[i, b >> 3] >> (7 - (b & 7))) & 1:
+            terpilih.append(i)
+            b -= max(int(bobot[i]), 0)
+    return np.array(terpilih[::-1], dtype=np.intp)
+
+
+def knapsack_dp(bobot: np.ndarray, nilai: np.ndarray, kapasitas: int,
+                kemajuan: Optional[Kemajuan] = None) -> np.ndarray:
+    """Knapsack 0/1 dengan `isi_dp` lalu `lacak_balik`; mengembalikan indeks item terpilih secara berurutan."""
+    if len(bobot) == 0 or kapasitas < 0:
+        return np.empty(0, dtype=np.intp)
+    baris, pilihan = isi_dp(bobot, nilai, kapasitas, kemajuan)
+    return lacak_balik(pilihan, bobot, kapasitas)
+
+
+def baris_maks_dp(bobot: np.ndarray, nilai: np.ndarray, kapasitas: int,
+                  kemajuan: Optional[Kemajuan] = None) -> np.ndarray:
+    """Baris DP knapsack 0/1 (nilai terbaik untuk setiap kapasitas) tanpa matriks pilihan."""
+    bobot = np.asarray(bobot, dtype=np.int64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    kapasitas = int(kapasitas)
+
+    baris = np.zeros(max(kapasitas + 1, 0), dtype=np.float64)
+    for i, (w, v) in enumerate(zip(bobot, nilai)):
+        w = max(int(w), 0)
+        if w <= kapasitas:
+            np.maximum(baris[w:], baris[:kapasitas + 1 - w] + v, out=baris[w:])
+        if kemajuan is not None:
+            kemajuan((i + 1) / len(bobot))
+    return baris
+
+
+def nilai_maks_dp(bobot: np.ndarray, nilai: np.ndarray, kapasitas: int,
+                  kemajuan: Optional[Kemajuan] = None) -> float:
+    """Nilai optimal knapsack 0/1 tanpa backtrack (hanya satu baris DP, tanpa matriks pilihan)."""
+    if len(bobot) == 0 or kapasitas < 0:
+        return 0.0
+    return float(baris_maks_dp(bobot, nilai, kapasitas, kemajuan)[-1])
+
+
+def kemajuan_bagian(kemajuan: Optional[Kemajuan], mulai: float, akhir: float) -> Optional[Kemajuan]:
+    """Memetakan kemajuan 0..1 satu tahap ke rentang [mulai, akhir] kemajuan keseluruhan."""
+    if kemajuan is None:
+        return None
+    return lambda f: kemajuan(mulai + (akhir - mulai) * f)
+
+
+def satuan_dari_epsilon(biaya: np.ndarray, anggaran: float, epsilon: float) -> float:
+    """Memilih satuan biaya (mode FPTAS) agar anggaran yang hilang karena pembulatan <= epsilon * anggaran.
+
+    Setiap item yang terpilih kehilangan paling banyak satu satuan karena pembulatan ke atas,
+    jadi satuan = epsilon * anggaran / k, dengan k jumlah item terbanyak yang mungkin muat.
+    """
+    if epsilon <= 0:
+        raise ValueError("epsilon harus lebih besar dari 0")
+    biaya = np.sort(np.asarray(biaya, dtype=np.float64))
+    k = int(np.searchsorted(np.cumsum(biaya), anggaran, side='right'))
+    return max(1.0, epsilon * anggaran / max(k, 1))
+
+
+def knapsack_terkuantisasi(biaya: np.ndarray, nilai: np.ndarray, anggaran: float,
+                           satuan: float = 1, epsilon: Optional[float] = None,
+                           kemajuan: Optional[Kemajuan] = None) -> Dict:
+    """Knapsack 0/1 dengan biaya dikuantisasi ke satuan tertentu (mis. Rp 10, Rp 100, Rp 1.000).
+
+    Biaya dibulatkan ke atas dan anggaran ke bawah, sehingga total biaya solusi tidak pernah
+    melebihi anggaran. Jika `epsilon` diberikan, satuan dipilih otomatis (mode FPTAS).
+    Batas kerugian dihitung dari DP kedua dengan biaya dibulatkan ke bawah, yang merupakan
+    batas atas nilai optimal sebenarnya.
+
+    Mengembalikan dict berisi 'terpilih', 'nilai', 'satuan', 'batas_atas' dan 'kerugian_maks'.
+    """
+    biaya = np.asarray(biaya, dtype=np.float64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    if epsilon is not None:
+        satuan = satuan_dari_epsilon(biaya, anggaran, epsilon)
+    if satuan <= 0:
+        raise ValueError("satuan biaya harus lebih besar dari 0")
+
+    if anggaran < 0 or len(biaya) == 0:
+        return {'terpilih': np.empty(0, dtype=np.intp), 'nilai': 0.0, 'satuan': satuan,
+                'batas_atas': 0.0, 'kerugian_maks': 0.0}
+
+    kapasitas = math.floor(anggaran / satuan)
+    bobot_atas = np.ceil(biaya / satuan).astype(np.int64)
+    bobot_bawah = np.floor(biaya / satuan).astype(np.int64)
+
+    # Tanpa pembulatan (biaya kelipatan satuan) hasil sudah optimal dan DP kedua tidak perlu
+    tanpa_pembulatan = np.array_equal(bobot_atas, bobot_bawah)
+    bagian_pertama = 1.0 if tanpa_pembulatan else 0.5
+    terpilih = knapsack_dp(bobot_atas, nilai, kapasitas, kemajuan_bagian(kemajuan, 0.0, bagian_pertama))
+    nilai_terpilih = float(nilai[terpilih].sum())
+    if tanpa_pembulatan:
+        batas_atas = nilai_terpilih
+    else:
+        batas_atas = max(nilai_maks_dp(bobot_bawah, nilai, kapasitas, kemajuan_bagian(kemajuan, 0.5, 1.0)),
+                         nilai_terpilih)
+
+    return {
+        'terpilih': terpilih,
+        'nilai': nilai_terpilih,
+        'satuan': satuan,
+        'batas_atas': batas_atas,
+        'kerugian_maks': batas_atas - nilai_terpilih,
+    }
+
+
+def knapsack_sweep(biaya: np.ndarray, nilai: np.ndarray, daftar_anggaran: List[float],
+                   satuan: float = 1, batas_memori: Optional[float] = None) -> Dict:
+    """Menjawab banyak anggaran sekaligus dengan satu kali pengisian DP terkuantisasi.
+
+    Baris DP terakhir sudah memuat nilai terbaik untuk setiap anggaran 0..maks, jadi DP diisi
+    sekali pada anggaran terbesar lalu di-backtrack untuk setiap anggaran. Batas atas tiap
+    anggaran diambil dari baris DP dengan biaya dibulatkan ke bawah (sekali isi juga).
+
+    Mengembalikan dict berisi 'hasil' (satu dict per anggaran, kunci seperti
+    `knapsack_terkuantisasi`), serta kurva 'kurva_anggaran' (rupiah) dan 'kurva_nilai'.
+    Satuan diperbesar bila tabel pada anggaran terbesar melewati `batas_memori` (lihat `satuan_untuk_memori`);
+    'perkiraan' (`perkiraan_dp` tabel itu) dan 'dibatasi_memori' disertakan di dict utama dan setiap hasil.
+    Bila satuan diperbesar, setiap hasil dibandingkan dengan greedy lewat `bandingkan_greedy` (kurva tetap
+    dari DP).
+    """
+    biaya = np.asarray(biaya, dtype=np.float64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    if satuan <= 0:
+        raise ValueError("satuan biaya harus lebih besar dari 0")
+    anggaran_maks = max(daftar_anggaran, default=-1)
+    satuan_aman = satuan_untuk_memori(len(biaya), anggaran_maks, satuan, batas_memori)
+    dibatasi_memori, satuan = satuan_aman != satuan, satuan_aman
+    perkiraan = perkiraan_dp(len(biaya), anggaran_maks, satuan)
+
+    kapasitas_list = [math.floor(anggaran / satuan) if anggaran >= 0 else -1 for anggaran in daftar_anggaran]
+    kapasitas_maks = max(kapasitas_list, default=-1)
+    bobot_atas = np.ceil(biaya / satuan).astype(np.int64)
+    bobot_bawah = np.floor(biaya / satuan).astype(np.int64)
+
+    if len(biaya) == 0 or kapasitas_maks < 0:
+        baris = np.zeros(max(kapasitas_maks + 1, 0), dtype=np.float64)
+        pilihan = np.zeros((0, 0), dtype=np.uint8)
+        baris_atas = baris
+    else:
+        baris, pilihan = isi_dp(bobot_atas, nilai, kapasitas_maks)
+        baris_atas = baris if np.array_equal(bobot_atas, bobot_bawah) else \
+            np.maximum(baris_maks_dp(bobot_bawah, nilai, kapasitas_maks), baris)
+
+    hasil = []
+    for anggaran, kapasitas in zip(daftar_anggaran, kapasitas_list):
+        if kapasitas < 0 or len(pilihan) == 0:
+            terpilih, batas_atas = np.empty(0, dtype=np.intp), 0.0
+        else:
+            terpilih, batas_atas = lacak_balik(pilihan, bobot_atas, kapasitas), float(baris_atas[kapasitas])
+        nilai_terpilih = float(nilai[terpilih].sum())
+        hasil_anggaran = {
+            'terpilih': terpilih,
+            'nilai': nilai_terpilih,
+            'satuan': satuan,
+            'batas_atas': batas_atas,
+            'kerugian_maks': max(batas_atas - nilai_terpilih, 0.0),
+            'perkiraan': perkiraan,
+            'dibatasi_memori': dibatasi_memori,
+        }
+        if dibatasi_memori:
+            hasil_anggaran = bandingkan_greedy(hasil_anggaran, biaya, nilai, anggaran)
+        hasil.append(hasil_anggaran)
+
+    return {
+        'hasil': hasil,
+        'perkiraan': perkiraan,
+        'dibatasi_memori': dibatasi_memori,
+        'kurva_anggaran': np.arange(len(baris), dtype=np.float64) * satuan,
+        'kurva_nilai': baris,
+    }
+
+
+def knapsack_pareto(biaya: np.ndarray, nilai: np.ndarray, anggaran: float,
+                    epsilon: Optional[float] = None, kemajuan: Optional[Kemajuan] = None,
+                    maks_status: Optional[int] = None) -> Optional[Dict]:
+    """Knapsack 0/1 dengan daftar status Pareto (Nemhauser-Ullmann).
+
+    Hanya status (biaya, nilai) yang tidak didominasi yang disimpan, digabung item demi item,
+    sehingga waktu bergantung pada jumlah status tersebut, bukan pada besar anggaran dalam
+    rupiah. Biaya dipakai apa adanya (tanpa pembulatan) dan jika total biaya semua item muat,
+    langsung ambil semuanya.
+
+    Karena kWh sebanding dengan biaya, hampir setiap subset bisa menjadi status Pareto. Dengan
+    `epsilon`, status yang nilainya berselisih kurang dari faktor (1 + epsilon / 2n) dipangkas
+    (hanya yang termurah disimpan), sehingga nilai hasil >= (1 - epsilon) * optimal.
+
+    Mengembalikan dict dengan kunci yang sama seperti `knapsack_terkuantisasi`, atau None bila jumlah
+    status setelah suatu item melewati `maks_status` (lihat `status_untuk_memori`).
+    """
+    biaya = np.asarray(biaya, dtype=np.float64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    n = len(biaya)
+    if anggaran < 0 or n == 0:
+        return {'terpilih': np.empty(0, dtype=np.intp), 'nilai': 0.0, 'satuan': None,
+                'batas_atas': 0.0, 'kerugian_maks': 0.0}
+
+    # Jalan pintas: semua item muat dalam anggaran
+    if biaya.sum() <= anggaran:
+        semua = np.flatnonzero(nilai > 0)
+        total = float(nilai[semua].sum())
+        return {'terpilih': semua, 'nilai': total, 'satuan': None,
+                'batas_atas': total, 'kerugian_maks': 0.0}
+
+    if epsilon is not None and epsilon <= 0:
+        raise ValueError("epsilon harus lebih besar dari 0")
+    log_delta = math.log1p(epsilon / (2 * n)) if epsilon is not None else None
+
+    # Status terurut menurut biaya dengan nilai naik tegas; riwayat menyimpan asal tiap status
+    status_biaya = np.zeros(1, dtype=np.float64)
+    status_nilai = np.zeros(1, dtype=np.float64)
+    riwayat = []
+    for i in range(n):
+        if kemajuan is not None:
+            kemajuan(i / n)
+        muat = np.flatnonzero(status_biaya + biaya[i] <= anggaran)
+        if nilai[i] <= 0 or len(muat) == 0:
+            riwayat.append(None)
+            continue
+        m = len(status_biaya)
+        asal = np.concatenate([np.arange(m, dtype=np.int32), muat.astype(np.int32)])
+        gabung_biaya = np.concatenate([status_biaya, status_biaya[muat] + biaya[i]])
+        gabung_nilai = np.concatenate([status_nilai, status_nilai[muat] + nilai[i]])
+
+        # Urutkan menurut biaya naik (nilai turun untuk biaya sama), buang yang didominasi
+        urutan = np.lexsort((-gabung_nilai, gabung_biaya))
+        nilai_urut = gabung_nilai[urutan]
+        maks_sebelum = np.maximum.accumulate(np.concatenate([[-np.inf], nilai_urut[:-1]]))
+        simpan = urutan[nilai_urut > maks_sebelum]
+
+        # Pangkas status yang nilainya jatuh di ember logaritmik yang sama (mode epsilon)
+        if log_delta is not None and len(simpan) > 1:
+            with np.errstate(divide='ignore'):
+                ember = np.floor(np.log(gabung_nilai[simpan]) / log_delta)
+            simpan = simpan[np.concatenate([[True], ember[1:] != ember[:-1]])]
+
+        if maks_status is not None and len(simpan) > maks_status:
+            return None
+        status_biaya, status_nilai = gabung_biaya[simpan], gabung_nilai[simpan]
+        riwayat.append((asal[simpan], simpan >= m))
+
+    # Status terakhir adalah yang bernilai terbesar; telusuri balik asalnya
+    j = len(status_nilai) - 1
+    terbaik = float(status_nilai[j])
+    terpilih = []
+    for i in range(n - 1, -1, -1):
+        if riwayat[i] is None:
+            continue
+        asal, ambil = riwayat[i]
+        if ambil[j]:
+            terpilih.append(i)
+        j = asal[j]
+
+    langkah = sum(r is not None for r in riwayat)
+    batas_atas = terbaik * math.exp(log_delta * langkah) if log_delta is not None else terbaik
+    return {'terpilih': np.array(terpilih[::-1], dtype=np.intp), 'nilai': terbaik, 'satuan': None,
+            'batas_atas': batas_atas, 'kerugian_maks': batas_atas - terbaik}
+
+
+def knapsack_greedy(biaya: np.ndarray, nilai: np.ndarray, anggaran: float) -> Dict:
+    """Greedy knapsack seperti versi Greedy: urutkan menurut konsumsi (nilai) terkecil, ambil selama muat.
+
+    Mengembalikan dict dengan kunci yang sama seperti `knapsack_terkuantisasi`; batas atas dari
+    relaksasi LP (knapsack pecahan) sehingga selisihnya adalah kerugian maksimum.
+    """
+    biaya = np.asarray(biaya, dtype=np.float64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    terpilih = []
+    biaya_sekarang = 0.0
+    for i in np.argsort(nilai, kind='stable'):
+        if biaya_sekarang + biaya[i] <= anggaran:
+            terpilih.append(i)
+            biaya_sekarang += biaya[i]
+    terpilih = np.array(terpilih, dtype=np.intp)  # Urutan pengambilan dipertahankan
+    nilai_terpilih = float(nilai[terpilih].sum())
+    batas_atas = max(batas_lp(biaya, nilai, anggaran), nilai_terpilih)
+    return {'terpilih': terpilih, 'nilai': nilai_terpilih, 'satuan': None,
+            'batas_atas': batas_atas, 'kerugian_maks': batas_atas - nilai_terpilih}
+
+
+def batas_lp(biaya: np.ndarray, nilai: np.ndarray, anggaran: float) -> float:
+    """Batas atas relaksasi LP (knapsack pecahan): isi menurut rasio nilai/biaya terbesar."""
+    biaya = np.asarray(biaya, dtype=np.float64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    if anggaran <= 0 or len(biaya) == 0:
+        return 0.0
+    urutan = np.argsort(-nilai / biaya, kind='stable')
+    urutan = urutan[nilai[urutan] > 0]
+    kum_biaya = np.cumsum(biaya[urutan])
+    kum_nilai = np.cumsum(nilai[urutan])
+    k = int(np.searchsorted(kum_biaya, anggaran, side='right'))
+    if k == len(urutan):
+        return float(kum_nilai[-1]) if k else 0.0
+    penuh = float(kum_nilai[k - 1]) if k else 0.0
+    sisa = anggaran - (float(kum_biaya[k - 1]) if k else 0.0)
+    return penuh + sisa * nilai[urutan[k]] / biaya[urutan[k]]
+
+
+def perbaiki_dengan_tukar(biaya: np.ndarray, nilai: np.ndarray, anggaran: float, terpilih: np.ndarray,
+                          maks_putaran: int = 200, tenggat: Optional[float] = None) -> np.ndarray:
+    """Local search: memperbaiki solusi layak dengan menambah satu item atau menukar satu item masuk-keluar.
+
+    Setiap putaran mengambil langkah dengan kenaikan nilai terbesar yang tetap muat, sampai tidak ada
+    langkah yang menaikkan nilai, `maks_putaran` tercapai, atau `tenggat` (detik `time.monotonic()`)
+    lewat. Item luar diurutkan menurut biaya dengan argmax nilai berjalan, jadi pasangan terbaik untuk
+    setiap item yang dikeluarkan dicari dengan `searchsorted` (O(n log n) per putaran). Untuk biaya yang
+    sebanding dengan nilai, ini mendorong total biaya sedekat mungkin ke anggaran. Mengembalikan indeks
+    item terpilih yang terurut.
+    """
+    biaya = np.asarray(biaya, dtype=np.float64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    ambil = np.zeros(len(biaya), dtype=bool)
+    ambil[terpilih] = True
+    for _ in range(maks_putaran):
+        if tenggat is not None and time.monotonic() > tenggat:
+            break
+        sisa = anggaran - float(biaya[ambil].sum())
+        luar = np.flatnonzero(~ambil & (nilai > 0))
+        if len(luar) == 0:
+            break
+        luar = luar[np.argsort(biaya[luar], kind='stable')]
+        biaya_luar = biaya[luar]
+        # terbaik[k]: posisi item luar bernilai terbesar di antara k + 1 item luar termurah
+        nilai_luar = nilai[luar]
+        posisi = np.arange(len(luar))
+        terbaik = np.maximum.accumulate(np.where(nilai_luar >= np.maximum.accumulate(nilai_luar), posisi, 0))
+
+        # Langkah tambah (keluar = None) dan tukar: item luar terbaik yang biayanya <= biaya keluar + sisa
+        dalam = np.flatnonzero(ambil)
+        ruang = np.concatenate([[sisa], biaya[dalam] + sisa])
+        k = np.searchsorted(biaya_luar, ruang, side='right') - 1
+        ada = k >= 0
+        masuk = np.where(ada, luar[terbaik[np.maximum(k, 0)]], -1)
+        kenaikan = np.where(ada, nilai[masuk] - np.concatenate([[0.0], nilai[dalam]]), -np.inf)
+        m = int(np.argmax(kenaikan))
+        if kenaikan[m] <= 0:
+            break
+        if m > 0:
+            ambil[dalam[m - 1]] = False
+        ambil[masuk[m]] = True
+    return np.flatnonzero(ambil)
+
+
+def knapsack_bnb(biaya: np.ndarray, nilai: np.ndarray, anggaran: float,
+                 maks_simpul: Optional[int] = 200_000, kemajuan: Optional[Kemajuan] = None,
+                 tenggat: Optional[float] = None) -> Dict:
+    """Knapsack 0/1 dengan branch-and-bound (DFS) tanpa tabel DP; memori O(n) selain tumpukan DFS.
+
+    Batas atas tiap simpul adalah minimum dari relaksasi LP (knapsack pecahan) dan batas kardinalitas:
+    paling banyak k item lagi yang muat (k dari biaya termurah), jadi nilainya paling banyak jumlah
+    k nilai terbesar. Bila rasio nilai/biaya semua item sama (kWh sebanding dengan Rp), batas LP sama
+    untuk setiap simpul dan tidak memangkas apa pun; bukti lalu datang dari incumbent yang didorong
+    ke batas akar oleh `perbaiki_dengan_tukar`, atau dari batas kardinalitas pada anggaran kecil.
+    Incumbent awal adalah yang terbaik dari greedy konsumsi dan greedy rasio setelah local search.
+
+    Biaya dipakai apa adanya. Optimalitas dibuktikan sampai toleransi relatif 1e-7 dari total nilai:
+    simpul yang batasnya tidak melebihi incumbent lebih dari toleransi dipangkas, dan batas terbesarnya
+    ikut masuk 'batas_atas', sehingga 'kerugian_maks' selalu celah yang terbukti. Jika `maks_simpul`
+    atau `tenggat` (detik `time.monotonic()`) tercapai, incumbent terbaik dikembalikan dengan batas
+    terbesar simpul yang belum ditelusuri sebagai 'batas_atas'. `kemajuan` dipanggil tiap 1.024
+    simpul dengan pecahan simpul terhadap `maks_simpul`.
+    """
+    biaya = np.asarray(biaya, dtype=np.float64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    if anggaran < 0 or len(biaya) == 0:
+        return {'terpilih': np.empty(0, dtype=np.intp), 'nilai': 0.0, 'satuan': None,
+                'batas_atas': 0.0, 'kerugian_maks': 0.0}
+
+    # Urut rasio nilai/biaya terbesar, seri oleh biaya terbesar; prefix sum untuk batas LP O(log n)
+    urutan = np.flatnonzero((nilai > 0) & (biaya <= anggaran))
+    urutan = urutan[np.lexsort((-biaya[urutan], -nilai[urutan] / biaya[urutan]))]
+    c = biaya[urutan].tolist()
+    v = nilai[urutan].tolist()
+    n = len(c)
+    kum_biaya = np.concatenate([[0.0], np.cumsum(c)])
+    kum_nilai = np.concatenate([[0.0], np.cumsum(v)])
+
+    # Batas kardinalitas: jumlah item yang muat dari biaya termurah, nilai dari k nilai terbesar.
+    # Bila nilai sudah turun sepanjang urutan (mis. biaya sebanding), k terbesar sufiks = k item pertamanya.
+    kum_biaya_naik = np.cumsum(np.sort(c))
+    kum_nilai_turun = np.concatenate([[0.0], np.cumsum(np.sort(v)[::-1])])
+    nilai_turun = bool(np.all(np.diff(v) <= 0))
+
+    def batas(i: int, sisa: float) -> float:
+        if i >= n:
+            return 0.0
+        k = int(np.searchsorted(kum_biaya, kum_biaya[i] + sisa, side='right')) - 1
+        hasil = kum_nilai[k] - kum_nilai[i]
+        if k < n:
+            hasil += (sisa - (kum_biaya[k] - kum_biaya[i])) * v[k] / c[k]
+        jumlah = int(np.searchsorted(kum_biaya_naik, sisa, side='right'))
+        kardinalitas = kum_nilai[min(i + jumlah, n)] - kum_nilai[i] if nilai_turun \
+            else kum_nilai_turun[min(jumlah, n)]
+        return float(min(hasil, kardinalitas))
+
+    # Incumbent awal: greedy konsumsi dan greedy rasio, masing-masing diperbaiki dengan local search
+    awal_greedy = knapsack_greedy(biaya, nilai, anggaran)['terpilih']
+    sisa, awal_rasio = anggaran, []
+    for i in range(n):
+        if c[i] <= sisa:
+            sisa -= c[i]
+            awal_rasio.append(int(urutan[i]))
+    terbaik, terpilih_awal = -1.0, None
+    for awal in (awal_greedy, np.array(awal_rasio, dtype=np.intp)):
+        kandidat = perbaiki_dengan_tukar(biaya, nilai, anggaran, awal, tenggat=tenggat)
+        nilai_kandidat = float(nilai[kandidat].sum())
+        if nilai_kandidat > terbaik:
+            terbaik, terpilih_awal = nilai_kandidat, kandidat
+    jejak_terbaik, dari_awal = None, True
+
+    # Toleransi relatif: celah sekecil ini tidak dikejar, tetapi tetap dilaporkan lewat batas_pangkas
+    toleransi = 1e-7 * max(sum(v), 1.0)
+    batas_akar = batas(0, anggaran)
+    simpul = 0
+    batas_pangkas = 0.0
+    sisa_batas = []
+    tumpukan = [(batas_akar, 0, anggaran, 0.0, None)]
+    while tumpukan:
+        batas_simpul, i, sisa, nilai_sekarang, jejak = tumpukan.pop()
+        if nilai_sekarang > terbaik:
+            terbaik, jejak_terbaik, dari_awal = nilai_sekarang, jejak, False
+        if i >= n:
+            continue
+        if batas_simpul <= terbaik + toleransi:
+            batas_pangkas = max(batas_pangkas, batas_simpul)
+            continue
+        simpul += 1
+        if (maks_simpul is not None and simpul > maks_simpul) or \
+                (tenggat is not None and simpul % 256 == 0 and time.monotonic() > tenggat):
+            sisa_batas = [batas_simpul] + [t[0] for t in tumpukan]
+            break
+        if kemajuan is not None and simpul % 1024 == 0 and maks_simpul:
+            kemajuan(simpul / maks_simpul)
+        anak = [(nilai_sekarang + batas(i + 1, sisa), i + 1, sisa, nilai_sekarang, jejak)]
+        if c[i] <= sisa:
+            anak.append((nilai_sekarang + v[i] + batas(i + 1, sisa - c[i]), i + 1, sisa - c[i],
+                         nilai_sekarang + v[i], (i, jejak)))
+        # Anak dengan batas terbesar didorong terakhir agar dijelajahi lebih dulu
+        anak.sort(key=lambda simpul_anak: simpul_anak[0])
+        for simpul_anak in anak:
+            if simpul_anak[0] > terbaik + toleransi:
+                tumpukan.append(simpul_anak)
+            else:
+                batas_pangkas = max(batas_pangkas, simpul_anak[0])
+
+    if dari_awal:
+        terpilih = terpilih_awal
+    else:
+        terpilih = []
+        while jejak_terbaik is not None:
+            terpilih.append(int(urutan[jejak_terbaik[0]]))
+            jejak_terbaik = jejak_terbaik[1]
+        terpilih = np.array(sorted(terpilih), dtype=np.intp)
+
+    # Batas atas = simpul terbuka atau terpangkas (dalam toleransi) terbesar, tidak lebih dari batas akar
+    batas_atas = max(min(max(sisa_batas + [batas_pangkas]), batas_akar), terbaik)
+    return {'terpilih': terpilih, 'nilai': terbaik, 'satuan': None,
+            'batas_atas': batas_atas, 'kerugian_maks': batas_atas - terbaik}
+
+
+def knapsack_anytime(biaya: np.ndarray, nilai: np.ndarray, anggaran: float, batas_waktu: float,
+                     satuan_biaya: float = 1, epsilon_awal: float = 0.1,
+                     maks_simpul_bnb: int = 20_000, batas_memori: Optional[float] = None) -> Iterator[Dict]:
+    """Knapsack anytime: yield solusi greedy segera, lalu solusi yang lebih baik sampai `batas_waktu` detik.
+
+    Tahapan: greedy, branch-and-bound dengan batas simpul dan tenggat, DP terkuantisasi dengan satuan
+    biaya yang makin halus (epsilon dibagi 4 tiap putaran) sampai `satuan_biaya`, lalu branch-and-bound
+    tanpa batas simpul sampai tenggat. Satu tahap DP hanya dimulai bila perkiraan waktunya
+    (`SEL_PER_DETIK`) masuk sisa waktu dan memorinya tidak melewati `batas_memori` (bawaan
+    `BATAS_MEMORI_DP`), dan dihentikan lewat callback kemajuan bila tenggat lewat; sisa waktu setelah
+    tahap DP tetap dipakai oleh tahap B&B terakhir. Batas atas terbaik dari semua tahap dipakai bersama,
+    sehingga setiap hasil yang di-yield membawa celah terbukti 'kerugian_maks' = 'batas_atas' - 'nilai'
+    (0 berarti optimal). Iterator berhenti saat celah tertutup, tenggat lewat, atau semua tahap selesai.
+    Hasil di-yield setiap kali nilai naik atau batas atas mengetat; kunci tambahan 'tahap' dan 'waktu'.
+    """
+    mulai = time.monotonic()
+    tenggat = mulai + batas_waktu
+    batas_memori = BATAS_MEMORI_DP if batas_memori is None else batas_memori
+    biaya = np.asarray(biaya, dtype=np.float64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    terbaik, batas_atas = None, math.inf
+
+    def cek_tenggat(_: float) -> None:
+        if time.monotonic() > tenggat:
+            raise PerhitunganDibatalkan()
+
+    def tahapan() -> Iterator[Tuple[str, Dict]]:
+        yield "greedy", knapsack_greedy(biaya, nilai, anggaran)
+        yield "bnb", knapsack_bnb(biaya, nilai, anggaran, maks_simpul_bnb, tenggat=tenggat)
+        if anggaran < 0 or len(biaya) == 0:
+            return
+        epsilon = epsilon_awal
+        while True:
+            satuan = max(satuan_biaya, satuan_dari_epsilon(biaya, anggaran, epsilon))
+            # Dua pengisian DP (pembulatan atas dan bawah) bila biaya tidak kelipatan satuan
+            perkiraan = perkiraan_dp(len(biaya), anggaran, satuan)
+            if time.monotonic() + perkiraan['detik'] > tenggat or perkiraan['byte'] > batas_memori:
+                break
+            try:
+                yield f"dp (satuan {satuan:g})", knapsack_terkuantisasi(biaya, nilai, anggaran, satuan,
+                                                                       kemajuan=cek_tenggat)
+            except PerhitunganDibatalkan:
+                return
+            if satuan <= satuan_biaya:
+                break
+            epsilon /= 4
+        # DP berikutnya tidak muat di sisa waktu atau memori: lanjutkan B&B tanpa batas simpul sampai tenggat
+        yield "bnb (sampai tenggat)", knapsack_bnb(biaya, nilai, anggaran, None, tenggat=tenggat)
+
+    # Toleransi relatif agar selisih pembulatan float tidak dihitung sebagai perbaikan atau celah;
+    # celah di bawah toleransi bukti `knapsack_bnb` (1e-7 relatif) dianggap tertutup
+    toleransi = 1e-9 * max(float(np.abs(nilai).sum()), 1.0)
+    toleransi_bukti = 1e-7 * max(float(np.abs(nilai).sum()), 1.0)
+    for tahap, hasil in tahapan():
+        membaik = terbaik is None or hasil['nilai'] > terbaik['nilai'] + toleransi
+        mengetat = hasil['batas_atas'] < batas_atas - toleransi
+        if membaik:
+            terbaik = dict(hasil, tahap=tahap)
+        batas_atas = min(batas_atas, hasil['batas_atas'])
+        if membaik or mengetat:
+            batas_atas = max(batas_atas, terbaik['nilai'])
+            yield dict(terbaik, batas_atas=batas_atas, kerugian_maks=batas_atas - terbaik['nilai'],
+                       solver="anytime", waktu=time.monotonic() - mulai)
+        if batas_atas - terbaik['nilai'] <= toleransi_bukti or time.monotonic() > tenggat:
+            return
+
+
+# --- Registry strategi knapsack ---
+# Setiap solver dipanggil sebagai solver(biaya, nilai, anggaran, satuan_biaya, epsilon, kemajuan,
+# batas_memori, batas_waktu) -> Dict; batas_waktu (detik) hanya dipakai solver yang bisa berhenti lebih awal
+SOLVER: Dict[str, Callable[..., Dict]] = {}
+
+# Perkiraan kasar laju pengisian baris DP NumPy (sel per detik) untuk kebijakan "auto"
+SEL_PER_DETIK = 2e8
+
+# Batas memori bawaan tabel DP (byte); di atasnya satuan biaya diperbesar agar tabel muat
+BATAS_MEMORI_DP = 512 * 1024 * 1024
+
+
+def daftarkan_solver(nama: str) -> Callable:
+    """Dekorator untuk mendaftarkan strategi knapsack baru ke `SOLVER`."""
+    def dekorator(fungsi: Callable[..., Dict]) -> Callable[..., Dict]:
+        SOLVER[nama] = fungsi
+        return fungsi
+    return dekorator
+
+
+@daftarkan_solver("dp")
+def _solver_dp(biaya, nilai, anggaran, satuan_biaya=1, epsilon=None, kemajuan=None, batas_memori=None,
+               batas_waktu=None):
+    return knapsack_terkuantisasi(biaya, nilai, anggaran, satuan_biaya, epsilon, kemajuan)
+
+
+@daftarkan_solver("greedy")
+def _solver_greedy(biaya, nilai, anggaran, satuan_biaya=1, epsilon=None, kemajuan=None, batas_memori=None,
+                   batas_waktu=None):
+    return knapsack_greedy(biaya, nilai, anggaran)
+
+
+@daftarkan_solver("pareto")
+def _solver_pareto(biaya, nilai, anggaran, satuan_biaya=1, epsilon=None, kemajuan=None, batas_memori=None,
+                   batas_waktu=None):
+    hasil = knapsack_pareto(biaya, nilai, anggaran, epsilon, kemajuan,
+                            maks_status=status_untuk_memori(len(biaya), batas_memori))
+    if hasil is None:
+        # Status Pareto tidak muat (biaya sebanding kWh): DP terkuantisasi dengan satuan yang aman memori
+        hasil = selesaikan_knapsack("dp", biaya, nilai, anggaran, satuan_biaya, epsilon,
+                                    kemajuan=kemajuan, batas_memori=batas_memori)
+        hasil['dibatasi_memori'] = True
+    return hasil
+
+
+@daftarkan_solver("bnb")
+def _solver_bnb(biaya, nilai, anggaran, satuan_biaya=1, epsilon=None, kemajuan=None, batas_memori=None,
+                batas_waktu=None):
+    tenggat = time.monotonic() + batas_waktu if batas_waktu is not None else None
+    return knapsack_bnb(biaya, nilai, anggaran, kemajuan=kemajuan, tenggat=tenggat)
+
+
+def perkiraan_sel_dp(n: int, anggaran: float, satuan_biaya: float = 1) -> int:
+    """Perkiraan jumlah sel tabel DP (n item x lebar anggaran dalam satuan biaya)."""
+    if anggaran < 0:
+        return 0
+    return n * (math.floor(anggaran / satuan_biaya) + 1)
+
+
+def perkiraan_dp(n: int, anggaran: float, satuan_biaya: float = 1) -> Dict[str, float]:
+    """Perkiraan biaya `knapsack_terkuantisasi` sebelum tabel dialokasikan.
+
+    Memori puncak adalah matriks pilihan bit-packed (n x (K + 8) / 8 byte) ditambah sekitar 17 byte
+    per kolom untuk baris float64, calon, dan mask ambil; waktu dihitung untuk dua pengisian
+    (pembulatan atas dan bawah) pada `SEL_PER_DETIK`. Mengembalikan dict 'kapasitas', 'sel',
+    'byte', dan 'detik'.
+    """
+    if n == 0 or anggaran < 0:
+        return {'kapasitas': 0, 'sel': 0, 'byte': 0, 'detik': 0.0}
+    kapasitas = math.floor(anggaran / satuan_biaya)
+    sel = n * (kapasitas + 1)
+    return {
+        'kapasitas': kapasitas,
+        'sel': sel,
+        'byte': n * ((kapasitas + 8) // 8) + 17 * (kapasitas + 1),
+        'detik': 2 * sel / SEL_PER_DETIK,
+    }
+
+
+def satuan_untuk_memori(n: int, anggaran: float, satuan_biaya: float = 1,
+                        batas_memori: Optional[float] = None) -> float:
+    """Memperbesar satuan biaya seperlunya agar perkiraan memori DP tidak melewati `batas_memori`.
+
+    `batas_memori` None berarti `BATAS_MEMORI_DP`. Satuan yang sudah aman dikembalikan apa adanya.
+    """
+    batas_memori = BATAS_MEMORI_DP if batas_memori is None else batas_memori
+    if perkiraan_dp(n, anggaran, satuan_biaya)['byte'] <= batas_memori:
+        return satuan_biaya
+    kapasitas_maks = max(int((batas_memori - n) // (n / 8 + 17)), 1)
+    return max(satuan_biaya, math.ceil(anggaran / kapasitas_maks))
+
+
+def status_untuk_memori(n: int, batas_memori: Optional[float] = None) -> int:
+    """Jumlah status Pareto maksimum per item agar `knapsack_pareto` tidak melewati `batas_memori`.
+
+    Riwayat menyimpan 5 byte per status per item (asal int32 dan bit ambil) sepanjang n item, ditambah
+    sekitar 160 byte per status untuk array gabungan dan pengurutan yang sedang dikerjakan.
+    """
+    batas_memori = BATAS_MEMORI_DP if batas_memori is None else batas_memori
+    return max(int(batas_memori // (5 * n + 160)), 1)
+
+
+def perkiraan_kerugian_pembulatan(biaya: np.ndarray, nilai: np.ndarray, anggaran: float,
+                                  satuan_biaya: float = 1) -> float:
+    """Perkiraan nilai yang hilang karena DP membulatkan biaya ke atas ke `satuan_biaya`.
+
+    Rata-rata setengah satuan per item terpilih (k item termurah yang muat) ditambah setengah satuan
+    dari anggaran yang dibulatkan ke bawah, dikali rasio nilai/biaya rata-rata (kWh per rupiah).
+    """
+    biaya = np.asarray(biaya, dtype=np.float64)
+    nilai = np.asarray(nilai, dtype=np.float64)
+    if len(biaya) == 0 or anggaran < 0 or biaya.sum() <= 0:
+        return 0.0
+    k = int(np.searchsorted(np.cumsum(np.sort(biaya)), anggaran, side='right'))
+    return (k + 1) * satuan_biaya / 2 * float(nilai.sum() / biaya.sum())
+
+
+def pilih_solver(biaya: np.ndarray, nilai: np.ndarray, anggaran: float, satuan_biaya: float = 1,
+                 target_latensi: float = 0.5) -> Tuple[str, float]:
+    """Kebijakan "auto": pilih strategi termurah yang memadai dari ukuran tabel DP dan target latensi.
+
+    - Semua item muat: "pareto" (langsung ambil semua, tanpa tabel).
+    - Satuan DP adalah `satuan_biaya` bila tabelnya selesai dalam target, selain itu diperbesar sampai
+      perkiraan waktunya masuk target.
+    - Bila `perkiraan_kerugian_pembulatan` pada satuan itu melebihi celah terbukti greedy, DP kasar
+      kalah dari greedy: "bnb" (diberi tenggat `target_latensi`, tidak pernah lebih buruk dari greedy).
+    - Selain itu: "dp" pada satuan itu.
+
+    Mengembalikan (nama solver, satuan biaya).
+    """
+    biaya = np.asarray(biaya, dtype=np.float64)
+    n = len(biaya)
+    if n == 0 or anggaran < 0 or biaya.sum() <= anggaran:
+        return "pareto", satuan_biaya
+    batas_sel = max(SEL_PER_DETIK * target_latensi, n)
+    satuan_dp = satuan_biaya
+    if perkiraan_sel_dp(n, anggaran, satuan_biaya) > batas_sel:
+        satuan_dp = max(satuan_biaya, math.ceil(n * anggaran / batas_sel))
+    celah_greedy = knapsack_greedy(biaya, nilai, anggaran)['kerugian_maks']
+    if perkiraan_kerugian_pembulatan(biaya, nilai, anggaran, satuan_dp) > celah_greedy:
+        return "bnb", satuan_biaya
+    return "dp", satuan_dp
+
+
+def rencana_solver(solver: str, biaya: np.ndarray, nilai: np.ndarray, anggaran: float, satuan_biaya: float = 1,
+                   epsilon: Optional[float] = None, target_latensi: float = 0.5,
+                   batas_memori: Optional[float] = None) -> Dict:
+    """Menentukan strategi yang benar-benar dijalankan `selesaikan_knapsack`, tanpa menjalankannya.
+
+    Menerapkan kebijakan "auto" (`pilih_solver`), mengubah `epsilon` menjadi satuan biaya untuk "dp",
+    lalu memperbesar satuan bila tabel melewati `batas_memori` (`satuan_untuk_memori`). Bila
+    `perkiraan_kerugian_pembulatan` pada satuan yang diperbesar itu melebihi celah terbukti greedy,
+    rencana beralih ke "bnb", yang tidak memakai tabel DP dan tidak pernah lebih buruk dari greedy.
+    Mengembalikan dict 'solver', 'satuan_biaya', 'epsilon' (sisa untuk solver non-DP),
+    'dibatasi_memori', 'perkiraan' (`perkiraan_dp`, None bila solver tidak memakai tabel DP), dan
+    'batas_waktu' (detik, `target_latensi` untuk "bnb" hasil "auto"; None berarti tanpa tenggat).
+    """
+    batas_waktu = None
+    satuan_diminta, otomatis = satuan_biaya, solver == "auto"
+    if otomatis:
+        if epsilon is None:
+            solver, satuan_biaya = pilih_solver(biaya, nilai, anggaran, satuan_biaya, target_latensi)
+            if solver == "bnb":
+                batas_waktu = target_latensi
+        else:
+            solver = "dp"
+    if solver not in SOLVER:
+        raise ValueError(f"Solver tidak dikenal: {solver}. Pilihan: {', '.join(sorted(SOLVER))}, auto")
+
+    dibatasi_memori, perkiraan = False, None
+    if solver == "dp":
+        if epsilon is not None:
+            satuan_biaya, epsilon = satuan_dari_epsilon(biaya, anggaran, epsilon), None
+        satuan_aman = satuan_untuk_memori(len(biaya), anggaran, satuan_biaya, batas_memori)
+        dibatasi_memori, satuan_biaya = satuan_aman != satuan_biaya, satuan_aman
+        if dibatasi_memori and perkiraan_kerugian_pembulatan(biaya, nilai, anggaran, satuan_biaya) > \
+                knapsack_greedy(biaya, nilai, anggaran)['kerugian_maks']:
+            solver, satuan_biaya = "bnb", satuan_diminta
+            batas_waktu = target_latensi if otomatis else None
+        else:
+            perkiraan = perkiraan_dp(len(biaya), anggaran, satuan_biaya)
+    return {
+        'solver': solver,
+        'satuan_biaya': satuan_biaya,
+        'epsilon': epsilon,
+        'dibatasi_memori': dibatasi_memori,
+        'perkiraan': perkiraan,
+        'batas_waktu': batas_waktu,
+    }
+
+
+def bandingkan_greedy(hasil: Dict, biaya: np.ndarray, nilai: np.ndarray, anggaran: float) -> Dict:
+    """Mempertahankan yang lebih baik dari hasil DP berasatuan kasar dan greedy.
+
+    Kedua batas atas sah, jadi yang lebih kecil dipakai. Bila greedy lebih baik, 'terpilih', 'nilai',
+    dan 'satuan' diambil dari greedy dan 'solver' menjadi "greedy"; kunci lain `hasil` dipertahankan.
+    """
+    greedy = knapsack_greedy(biaya, nilai, anggaran)
+    batas_atas = min(hasil['batas_atas'], greedy['batas_atas'])
+    if greedy['nilai'] > hasil['nilai']:
+        hasil = dict(hasil, terpilih=greedy['terpilih'], nilai=greedy['nilai'], satuan=None, solver="greedy")
+    batas_atas = max(batas_atas, hasil['nilai'])
+    return dict(hasil, batas_atas=batas_atas, kerugian_maks=batas_atas - hasil['nilai'])
+
+
+def selesaikan_knapsack(solver: str, biaya: np.ndarray, nilai: np.ndarray, anggaran: float,
+                        satuan_biaya: float = 1, epsilon: Optional[float] = None,
+                        target_latensi: float = 0.5, kemajuan: Optional[Kemajuan] = None,
+                        batas_memori: Optional[float] = None) -> Dict:
+    """Menjalankan strategi `solver` dari registry ("auto" memilih lewat `pilih_solver`).
+
+    Hasil berisi kunci yang sama seperti `knapsack_terkuantisasi` ditambah 'solver'. `kemajuan`
+    diteruskan ke solver dan dipanggil dengan 1.0 saat selesai. `batas_memori` juga diteruskan ke setiap
+    solver; "pareto" yang statusnya melewati batas itu beralih ke "dp" (tercatat di 'solver').
+
+    Strategi, satuan, dan pembatasan memori ditentukan oleh `rencana_solver`: sebelum tabel DP
+    dialokasikan, biayanya diperkirakan dengan `perkiraan_dp`; bila memorinya melewati `batas_memori`
+    (bawaan `BATAS_MEMORI_DP`), satuan biaya diperbesar sampai muat, atau beralih ke "bnb" bila DP kasar
+    diperkirakan kalah dari greedy. DP yang tetap dijalankan pada satuan lebih kasar dari `satuan_biaya`
+    dibandingkan dengan greedy lewat `bandingkan_greedy`. Hasil juga berisi 'perkiraan' dan
+    'dibatasi_memori'.
+    """
+    rencana = rencana_solver(solver, biaya, nilai, anggaran, satuan_biaya, epsilon, target_latensi, batas_memori)
+    hasil = SOLVER[rencana['solver']](biaya, nilai, anggaran, rencana['satuan_biaya'], rencana['epsilon'], kemajuan,
+                                      batas_memori=batas_memori, batas_waktu=rencana['batas_waktu'])
+    # Solver yang beralih ke strategi lain (mis. "pareto" ke "dp") sudah mengisi kunci ini sendiri
+    hasil.setdefault('solver', rencana['solver'])
+    hasil.setdefault('perkiraan', rencana['perkiraan'])
+    hasil['dibatasi_memori'] = hasil.get('dibatasi_memori', False) or rencana['dibatasi_memori']
+    if rencana['solver'] == "dp" and rencana['satuan_biaya'] != satuan_biaya:
+        hasil = bandingkan_greedy(hasil, biaya, nilai, anggaran)
+    if kemajuan is not None:
+        kemajuan(1.0)
+    return hasil
@@ -0,0 +1,1030 @@
+"""Inti penjadwal daya: data konsumsi, tahap prioritas/terjadwal/tambahan, dan format jadwal.
+
+Dipakai bersama oleh aplikasi Greedy dan DP; strategi knapsack dipilih per panggilan lewat `solver`.
+"""
+import contextlib
+import datetime
+import hashlib
+import heapq
+import io
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Iterator, List, Dict, Tuple, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd  # Dimuat malas: hanya dibutuhkan saat membangun tensor dari CSV
+
+from cache_jadwal import CacheLRU, CacheSQLite
+from knapsack import (Kemajuan, PerhitunganDibatalkan, bandingkan_greedy, knapsack_anytime, knapsack_sweep,
+                      rencana_solver, selesaikan_knapsack)
+from penyimpanan import PenyimpananRumahTangga
+
+# Lokasi bawaan dataset konsumsi, di folder yang sama dengan modul ini
+PATH_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data bersih.csv')
+
+# Urutan hari pada sumbu kedua tensor konsumsi
+HARI = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Naikkan bila susunan file cache tensor berubah agar cache lama dibangun ulang
+VERSI_CACHE_TENSOR = 1
+
+def input_terjemahan(input_pengguna: str, peta_terjemahan: Dict[str, str]) -> List[str]:
+    """Menerjemahkan daftar nama peralatan dalam Bahasa Indonesia ke Bahasa Inggris menggunakan mapping."""
+    return [peta_terjemahan.get(item.strip(), item.strip()) for item in input_pengguna.split(',')]
+
+def hari_terjemahan(input_pengguna: List[str], peta_terjemahan: Dict[str, str]) -> List[str]:
+    """Menerjemahkan daftar nama hari dalam Bahasa Indonesia ke Bahasa Inggris menggunakan mapping."""
+    return [peta_terjemahan.get(hari.strip(), hari.strip()) for hari in input_pengguna]
+
+peta_terjemahan = {
+    'Kulkas': 'Refrigerator',
+    'Mesin pencuci piring': 'Dishwasher',
+    'Lampu': 'Lighting',
+    'Elektronik': 'Electronics',
+    'Mesin cuci': 'Washing Machine',
+    'Ac': 'HVAC', 
+    'AC': 'HVAC'
+}
+
+peta_terjemahan_hari = {
+    'Senin': 'Monday',
+    'Selasa': 'Tuesday',
+    'Rabu': 'Wednesday',
+    'Kamis': 'Thursday',
+    'Jumat': 'Friday',
+    'Sabtu': 'Saturday',
+    'Minggu': 'Sunday'
+}
+
+def bangun_tensor_konsumsi(data_csv: 'pd.DataFrame', hari: List[str]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Menyusun data CSV menjadi tensor konsumsi kontigu berbentuk (peralatan, hari, jam) sekali saat dimuat.
+
+    Mengembalikan daftar nama peralatan (urutan = kode peralatan), tensor konsumsi kWh,
+    dan mask boolean jam yang benar-benar ada di data.
+    """
+    import pandas as pd
+
+    peralatan = sorted(data_csv['appliance'].unique())
+    kode_alat = pd.Categorical(data_csv['appliance'], categories=peralatan).codes
+    kode_hari = pd.Categorical(data_csv['day_of_week'], categories=hari).codes
+    kode_jam = pd.to_numeric(data_csv['time'].str.slice(0, 2), errors='coerce').fillna(-1).astype(int).to_numpy()
+    valid = (kode_alat >= 0) & (kode_hari >= 0) & (kode_jam >= 0) & (kode_jam < 24)
+
+    konsumsi = np.zeros((len(peralatan), len(hari), 24), dtype=np.float64)
+    tersedia = np.zeros(konsumsi.shape, dtype=bool)
+    indeks = (kode_alat[valid], kode_hari[valid], kode_jam[valid])
+    konsumsi[indeks] = data_csv['energy_consumption_kWh'].to_numpy(dtype=np.float64)[valid]
+    tersedia[indeks] = True
+    return peralatan, konsumsi, tersedia
+
+def hash_file(path: str) -> str:
+    """Menghitung SHA-256 isi file secara bertahap per 1 MB."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for blok in iter(lambda: f.read(1 << 20), b''):
+            h.update(blok)
+    return h.hexdigest()
+
+
+def tulis_cache_tensor(path_cache: str, peralatan: List[str], konsumsi: np.ndarray, tersedia: np.ndarray,
+                       stat: os.stat_result, sidik_csv: str) -> None:
+    """Menulis tensor beserta mtime, ukuran, dan hash CSV sumber ke `.npz` secara atomik (file sementara + rename)."""
+    path_sementara = f"{path_cache}.{os.getpid()}.tmp.npz"
+    try:
+        np.savez(path_sementara, peralatan=np.array(peralatan, dtype=str), konsumsi=konsumsi, tersedia=tersedia,
+                 meta=np.array([VERSI_CACHE_TENSOR, stat.st_mtime_ns, stat.st_size], dtype=np.int64),
+                 sidik_csv=np.array(sidik_csv))
+        os.replace(path_sementara, path_cache)
+    except OSError:
+        # Folder tidak bisa ditulis: tetap jalan tanpa cache
+        if os.path.exists(path_sementara):
+            os.remove(path_sementara)
+
+
+def muat_tensor(path_csv: str = PATH_DATA, path_cache: Optional[str] = None) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Memuat tensor (peralatan, konsumsi, tersedia) dari cache biner `.npz`, membangunnya dari CSV bila perlu.
+
+    Cache dianggap valid bila mtime dan ukuran CSV sama dengan yang tercatat; jika berbeda, hash isi CSV
+    dibandingkan dulu sehingga CSV yang hanya disentuh tidak memicu parsing ulang. Bawaan `path_cache`
+    adalah `<nama csv>.tensor.npz` di sebelah CSV.
+    """
+    if path_cache is None:
+        path_cache = os.path.splitext(path_csv)[0] + '.tensor.npz'
+    stat = os.stat(path_csv)
+    try:
+        with np.load(path_cache, allow_pickle=False) as arsip:
+            versi, mtime_ns, ukuran = arsip['meta'].tolist()
+            if versi == VERSI_CACHE_TENSOR:
+                peralatan = arsip['peralatan'].tolist()
+                konsumsi, tersedia = arsip['konsumsi'], arsip['tersedia']
+                if (mtime_ns, ukuran) == (stat.st_mtime_ns, stat.st_size):
+                    return peralatan, konsumsi, tersedia
+                sidik_csv = hash_file(path_csv)
+                if str(arsip['sidik_csv']) == sidik_csv:
+                    tulis_cache_tensor(path_cache, peralatan, konsumsi, tersedia, stat, sidik_csv)
+                    return peralatan, konsumsi, tersedia
+    except (OSError, KeyError, ValueError):
+        pass
+
+    import pandas as pd
+
+    peralatan, konsumsi, tersedia = bangun_tensor_konsumsi(pd.read_csv(path_csv), HARI)
+    tulis_cache_tensor(path_cache, peralatan, konsumsi, tersedia, stat, hash_file(path_csv))
+    return peralatan, konsumsi, tersedia
+
+# Bobot bit tiap jam untuk mengubah mask boolean (..., 24) menjadi bitmask 24-bit
+BOBOT_BIT_JAM = 1 << np.arange(24, dtype=np.int64)
+
+
+def jam_dari_bit(mask: np.ndarray) -> np.ndarray:
+    """Kebalikan `BOBOT_BIT_JAM`: bitmask 24-bit berbentuk (...) menjadi mask boolean (..., 24)."""
+    return ((mask[..., None] >> np.arange(24)) & 1).astype(bool)
+
+
+@lru_cache(maxsize=None)
+def mask_rentang_jam(mulai_jam: int, akhir_jam: int) -> np.ndarray:
+    """Mask boolean 24 jam untuk rentang prioritas, termasuk rentang yang melewati tengah malam (mis. 22-6).
+
+    Hasil di-cache dan hanya-baca sehingga setiap rentang cukup dihitung sekali.
+    """
+    jam = np.arange(24)
+    if mulai_jam > akhir_jam:
+        mask = (jam >= mulai_jam) | (jam <= akhir_jam)
+    else:
+        mask = (jam >= mulai_jam) & (jam <= akhir_jam)
+    mask.setflags(write=False)
+    return mask
+
+def jendela_termurah(konsumsi: np.ndarray, tersedia: np.ndarray, k: int) -> np.ndarray:
+    """Mencari jam awal jendela k jam berturut-turut dengan konsumsi terkecil memakai prefix sum.
+
+    `konsumsi` dan `tersedia` berbentuk (..., 24); hanya jendela yang semua jamnya ada di data
+    yang dipertimbangkan. Biaya O(24) per baris berapa pun panjang jendelanya. Mengembalikan
+    array (...) berisi jam awal, atau -1 jika tidak ada jendela yang valid.
+    """
+    jumlah_jam = konsumsi.shape[-1]
+    if k <= 0 or k > jumlah_jam:
+        return np.full(konsumsi.shape[:-1], -1, dtype=np.intp)
+
+    nol = np.zeros(konsumsi.shape[:-1] + (1,))
+    prefix = np.concatenate([nol, np.cumsum(np.where(tersedia, konsumsi, 0.0), axis=-1)], axis=-1)
+    prefix_ada = np.concatenate([nol, np.cumsum(tersedia, axis=-1)], axis=-1)
+    total = prefix[..., k:] - prefix[..., :-k]
+    lengkap = (prefix_ada[..., k:] - prefix_ada[..., :-k]) == k
+    total = np.where(lengkap, total, np.inf)
+    awal = np.argmin(total, axis=-1)
+    return np.where(lengkap.any(axis=-1), awal, -1)
+
+def jadwal_jalan_mingguan(konsumsi: np.ndarray, tersedia: np.ndarray, wajib: np.ndarray,
+                          durasi: int, jumlah_jalan: int, lintas_hari: bool = False) -> Optional[List[int]]:
+    """Menempatkan `jumlah_jalan` jalan tak tumpang tindih sepanjang `durasi` jam pada setiap hari wajib.
+
+    `konsumsi` dan `tersedia` berbentuk (7 * 24,) untuk satu peralatan, Senin 00:00 sampai Minggu 23:00;
+    `wajib` berbentuk (7,) menandai hari yang harus mendapat jalan. Dengan `lintas_hari`, jendela boleh
+    melewati tengah malam, termasuk dari Minggu ke Senin (minggu dianggap melingkar). Memakai DP
+    interval atas jam x jumlah jalan hari itu, dengan biaya jendela dari prefix sum.
+
+    Mengembalikan daftar jam awal (indeks mingguan) yang meminimalkan total konsumsi,
+    atau None jika tidak ada penempatan yang valid.
+    """
+    jumlah_hari = len(wajib)
+    H = jumlah_hari * 24
+    if durasi <= 0 or durasi > 24 or jumlah_jalan <= 0:
+        return None
+
+    # Biaya jendela melingkar untuk setiap jam awal
+    nilai = np.where(tersedia, konsumsi, 0.0)
+    prefix = np.concatenate([[0.0], np.cumsum(np.concatenate([nilai, nilai[:durasi]]))])
+    prefix_ada = np.concatenate([[0], np.cumsum(np.concatenate([tersedia, tersedia[:durasi]]))])
+    biaya_jendela = (prefix[durasi:durasi + H] - prefix[:H]).tolist()
+    valid = ((prefix_ada[durasi:durasi + H] - prefix_ada[:H]) == durasi).tolist()
+    kebutuhan = [jumlah_jalan if wajib[d] else 0 for d in range(jumlah_hari)]
+    k = jumlah_jalan
+    INF = float('inf')
+
+    terbaik, jejak_terbaik = INF, None
+    # w = jam Senin yang sudah terpakai oleh jalan Minggu yang melingkar
+    for w in (range(durasi) if lintas_hari and wajib[-1] else [0]):
+        f = [[INF] * (k + 1) for _ in range(H + 25)]
+        asal = [[None] * (k + 1) for _ in range(H + 25)]
+        f[w][0] = 0.0
+
+        def relaksasi(t: int, j: int, nilai_baru: float, dari: Tuple[int, int, bool]) -> None:
+            if nilai_baru < f[t][j]:
+                f[t][j] = nilai_baru
+                asal[t][j] = dari
+
+        for t in range(w, H):
+            d = t // 24
+            batas_hari = (d + 1) * 24
+            for j in range(k + 1):
+                sekarang = f[t][j]
+                if sekarang == INF:
+                    continue
+                # Jam t dilewati
+                if t + 1 == batas_hari:
+                    if j == kebutuhan[d]:
+                        relaksasi(t + 1, 0, sekarang, (t, j, False))
+                else:
+                    relaksasi(t + 1, j, sekarang, (t, j, False))
+                # Jalan dimulai pada jam t
+                if j < kebutuhan[d] and valid[t]:
+                    akhir = t + durasi
+                    if akhir < batas_hari:
+                        relaksasi(akhir, j + 1, sekarang + biaya_jendela[t], (t, j, True))
+                    elif j + 1 == kebutuhan[d] and (akhir == batas_hari or lintas_hari):
+                        if akhir <= H or akhir == H + w:
+                            relaksasi(akhir, 0, sekarang + biaya_jendela[t], (t, j, True))
+
+        if f[H + w][0] < terbaik:
+            terbaik = f[H + w][0]
+            awal_jalan = []
+            t, j = H + w, 0
+            while (t, j) != (w, 0):
+                t, j, mulai = asal[t][j]
+                if mulai:
+                    awal_jalan.append(t)
+            jejak_terbaik = awal_jalan[::-1]
+
+    return jejak_terbaik
+
+# Nilai bawaan argumen opsional `optimalkan_jadwal` untuk permintaan batch
+BAWAAN_PERMINTAAN = {
+    'satuan_biaya': 1,
+    'epsilon': None,
+    'solver': "dp",
+    'target_latensi': 0.5,
+    'jam_dibutuhkan': 2,
+    'jumlah_jalan': 1,
+    'lintas_hari': False,
+}
+
+
+def kunci_opsi(opsi: Union[int, Dict[str, int]]) -> Union[int, Tuple[Tuple[str, int], ...]]:
+    """Mengubah opsi angka atau dict per peralatan menjadi kunci yang bisa di-hash."""
+    return tuple(sorted(opsi.items())) if isinstance(opsi, dict) else opsi
+
+
+def sidik_tensor(peralatan: List[str], konsumsi: np.ndarray, tersedia: np.ndarray) -> str:
+    """Menghitung sidik (hash SHA-256) indeks profil sebagai versi dataset untuk kunci cache."""
+    h = hashlib.sha256()
+    h.update("\x00".join(peralatan).encode())
+    h.update(np.ascontiguousarray(konsumsi, dtype=np.float64).tobytes())
+    h.update(np.ascontiguousarray(tersedia, dtype=bool).tobytes())
+    return h.hexdigest()
+
+# --- Backend PenjadwalDaya ---
+class PenjadwalDaya:
+    def __init__(self, data_csv: Optional['pd.DataFrame'], harga_per_kwh: float = 1400):
+        self.data = data_csv
+        self.harga_per_kwh = harga_per_kwh
+        self.hari = list(HARI)
+        self.jam = [f"{str(h).zfill(2)}:00" for h in range(24)]
+        self.kode_hari = {hari: i for i, hari in enumerate(self.hari)}
+        self.kode_jam = {jam: h for h, jam in enumerate(self.jam)}
+        if data_csv is not None:
+            self.pasang_tensor(*bangun_tensor_konsumsi(data_csv, self.hari))
+        self.info_tambahan = {}
+        self.cache_hasil = CacheLRU()
+        self.cache_persisten: Optional[CacheSQLite] = None
+        self.batas_memori_dp: Optional[float] = None  # Byte; None = knapsack.BATAS_MEMORI_DP
+
+    @classmethod
+    def dari_tensor(cls, peralatan: List[str], konsumsi: np.ndarray, tersedia: np.ndarray,
+                    harga_per_kwh: float = 1400) -> 'PenjadwalDaya':
+        """Membuat PenjadwalDaya langsung dari tensor (peralatan, hari, jam) tanpa CSV, mis. dari shared memory."""
+        penjadwal = cls(None, harga_per_kwh)
+        penjadwal.pasang_tensor(peralatan, konsumsi, tersedia)
+        return penjadwal
+
+    @classmethod
+    def dari_penyimpanan(cls, penyimpanan: PenyimpananRumahTangga, rumah: str,
+                         mulai: Optional[datetime.date] = None, akhir: Optional[datetime.date] = None,
+                         harga_per_kwh: float = 1400) -> 'PenjadwalDaya':
+        """Membuat PenjadwalDaya untuk satu rumah langsung dari penyimpanan memory-mapped pada rentang [mulai, akhir)."""
+        return cls.dari_tensor(*penyimpanan.profil(rumah, mulai, akhir), harga_per_kwh)
+
+    def pasang_tensor(self, peralatan: List[str], konsumsi: np.ndarray, tersedia: np.ndarray) -> None:
+        """Memasang tensor konsumsi dan mask ketersediaan sebagai indeks profil."""
+        self.peralatan, self.konsumsi, self.tersedia = list(peralatan), konsumsi, tersedia
+        # Indeks profil hanya-baca agar aman dibagikan antar permintaan
+        self.konsumsi.setflags(write=False)
+        self.tersedia.setflags(write=False)
+        self.kode_peralatan = {alat: i for i, alat in enumerate(self.peralatan)}
+        self.sidik_data = sidik_tensor(self.peralatan, konsumsi, tersedia)
+        # Bitmask 24-bit jam yang ada di data per (peralatan, hari)
+        self.mask_tersedia = (tersedia * BOBOT_BIT_JAM).sum(axis=2)
+        # Indeks jam per peralatan, urut konsumsi naik (stabil): ([kWh], [hari * 24 + jam]) untuk greedy malas
+        self.urutan_konsumsi = []
+        for a in range(len(self.peralatan)):
+            konsumsi_alat = konsumsi[a].ravel()
+            slot = np.flatnonzero(tersedia[a].ravel())
+            slot = slot[np.argsort(konsumsi_alat[slot], kind='stable')]
+            self.urutan_konsumsi.append((konsumsi_alat[slot].tolist(), slot.tolist()))
+
+    def konsumsi_harian(self, peralatan: str, hari: str) -> Dict[str, float]:
+        """Mengambil konsumsi per jam untuk peralatan tertentu pada hari tertentu dari tensor konsumsi."""
+        if peralatan not in self.kode_peralatan or hari not in self.kode_hari:
+            return {}
+        a, d = self.kode_peralatan[peralatan], self.kode_hari[hari]
+        return {self.jam[h]: float(self.konsumsi[a, d, h]) for h in np.flatnonzero(self.tersedia[a, d])}
+
+    def kode_dari(self, peralatan: List[str]) -> List[Tuple[int, str]]:
+        """Mengubah nama peralatan menjadi (kode, nama); peralatan yang tidak ada di data dilewati."""
+        return [(self.kode_peralatan[alat], alat) for alat in peralatan if alat in self.kode_peralatan]
+    
+    def hitung_penggunaan_prioritas(self, peralatan_list: List[str], mulai_jam: int, akhir_jam: int,
+                                    terisi: Optional[np.ndarray] = None) -> Dict[str, Tuple[float, int, List[str]]]:
+        """Menghitung total konsumsi untuk jam prioritas sepanjang minggu dengan beberapa peralatan.
+
+        Dihitung sebagai satu reduksi bermask atas tensor (peralatan, hari, jam). Jam terpakai per hari
+        dikembalikan sebagai bitmask 24-bit (bit h = jam h); ubah ke teks dengan `jam_dari_mask`.
+        Bila `terisi` (bitmask (peralatan, hari), lihat `tahap_tetap`) diberikan, jam yang ditagih
+        setiap peralatan ditambahkan ke dalamnya.
+        """
+        penggunaan_prioritas = {}
+        if not peralatan_list:
+            return penggunaan_prioritas
+
+        kode_alat = np.array([self.kode_peralatan[alat] for alat in peralatan_list if alat in self.kode_peralatan],
+                             dtype=np.intp)
+        terpakai = self.tersedia[kode_alat] & mask_rentang_jam(mulai_jam, akhir_jam)
+        total_harian = np.where(terpakai, self.konsumsi[kode_alat], 0.0).sum(axis=(0, 2))
+        mask_harian = (terpakai.any(axis=0) * BOBOT_BIT_JAM).sum(axis=1)
+        if terisi is not None:
+            terisi[kode_alat] |= (terpakai * BOBOT_BIT_JAM).sum(axis=2)
+
+        for d, hari in enumerate(self.hari):
+            penggunaan_prioritas[hari] = (float(total_harian[d]), int(mask_harian[d]), list(peralatan_list))
+        
+        return penggunaan_prioritas
+
+    def jam_dari_mask(self, mask: int) -> List[str]:
+        """Mengubah bitmask 24-bit jam menjadi daftar jam ("HH:00") untuk ditampilkan."""
+        return [self.jam[h] for h in range(24) if mask >> h & 1]
+
+    def slot_ganda(self, jadwal: Dict) -> List[Tuple[str, str, str]]:
+        """Mengembalikan (alat, hari, jam) yang ditagih lebih dari sekali dalam `jadwal`; kosong bila benar.
+
+        Menghitung ulang setiap jam dari ketiga tahap, jadi tagihan ganda antar tahap maupun di dalam satu
+        tahap (mis. nama peralatan berulang) ikut terdeteksi. Untuk pemeriksaan; tidak dipanggil saat
+        menyusun jadwal.
+        """
+        hitungan = Counter()
+        for hari, (_, mask, peralatan) in jadwal['penggunaan_prioritas'].items():
+            d = self.kode_hari[hari]
+            for alat in peralatan:
+                if alat in self.kode_peralatan:
+                    a = self.kode_peralatan[alat]
+                    hitungan.update((alat, hari, jam) for jam in self.jam_dari_mask(mask & int(self.mask_tersedia[a, d])))
+        for kunci in ('penggunaan_terjadwal', 'penggunaan_tambahan'):
+            for hari, daftar in jadwal[kunci].items():
+                hitungan.update((alat, hari, jam) for jam, _, alat in daftar)
+        return sorted(slot for slot, jumlah in hitungan.items() if jumlah > 1)
+
+    def temukan_penggunaan_terjadwal(self, peralatan: List[str], hari_terjadwal: List[str],
+                                     jam_dibutuhkan: Union[int, Dict[str, int]] = 2,
+                                     jumlah_jalan: Union[int, Dict[str, int]] = 1,
+                                     lintas_hari: bool = False,
+                                     terisi: Optional[np.ndarray] = None) -> Dict[str, List[Tuple[str, float, str]]]:
+        """Menemukan jam optimal untuk penggunaan terjadwal.
+
+        `jam_dibutuhkan` (durasi satu jalan) dan `jumlah_jalan` (jalan per hari) bisa satu angka untuk
+        semua peralatan atau dict per peralatan. Dengan `lintas_hari` (bawaan mati, sehingga hasil sama
+        dengan perilaku awal satu jendela per hari), jendela boleh melewati tengah malam (termasuk
+        Minggu ke Senin) dan jamnya dicatat pada hari sebenarnya; penempatan memakai
+        `jadwal_jalan_mingguan`. Tanpa lintas hari dan dengan satu jalan, jendela termurah dicari dengan
+        prefix sum sekaligus untuk semua peralatan dan hari yang diminta. Jam yang bitnya menyala di
+        `terisi` (mis. sudah ditagih tahap prioritas) tidak dipakai, lalu jam terjadwal ditambahkan ke
+        dalamnya.
+        """
+        penggunaan_terjadwal = {}
+        alat_valid = self.kode_dari(peralatan)
+        hari_valid = [(self.kode_hari[hari], hari) for hari in hari_terjadwal if hari in self.kode_hari]
+        if not alat_valid or not hari_valid:
+            return penggunaan_terjadwal
+
+        def durasi(alat: str) -> int:
+            return jam_dibutuhkan.get(alat, 2) if isinstance(jam_dibutuhkan, dict) else jam_dibutuhkan
+
+        def jalan(alat: str) -> int:
+            return jumlah_jalan.get(alat, 1) if isinstance(jumlah_jalan, dict) else jumlah_jalan
+
+        if lintas_hari or any(jalan(alat) != 1 for _, alat in alat_valid):
+            wajib = np.zeros(len(self.hari), dtype=bool)
+            wajib[[d for d, _ in hari_valid]] = True
+            for a, alat in alat_valid:
+                tersedia = self.tersedia[a] if terisi is None else self.tersedia[a] & ~jam_dari_bit(terisi[a])
+                awal_jalan = jadwal_jalan_mingguan(self.konsumsi[a].ravel(), tersedia.ravel(), wajib,
+                                                   durasi(alat), jalan(alat), lintas_hari)
+                for awal in awal_jalan or []:
+                    for t in range(awal, awal + durasi(alat)):
+                        d, h = divmod(t % (len(self.hari) * 24), 24)
+                        penggunaan_terjadwal.setdefault(self.hari[d], []).append(
+                            (self.jam[h], float(self.konsumsi[a, d, h]), alat)
+                        )
+                        if terisi is not None:
+                            terisi[a, d] |= 1 << h
+            return penggunaan_terjadwal
+
+        # Peralatan dengan durasi yang sama dihitung dalam satu operasi vektor
+        kode_hari = np.array([d for d, _ in hari_valid], dtype=np.intp)
+        awal_optimal = {}
+        for k in sorted({durasi(alat) for _, alat in alat_valid}):
+            grup = [(a, alat) for a, alat in alat_valid if durasi(alat) == k]
+            kode_alat = np.array([a for a, _ in grup], dtype=np.intp)
+            tersedia = self.tersedia[np.ix_(kode_alat, kode_hari)]
+            if terisi is not None:
+                tersedia = tersedia & ~jam_dari_bit(terisi[np.ix_(kode_alat, kode_hari)])
+            awal = jendela_termurah(self.konsumsi[np.ix_(kode_alat, kode_hari)], tersedia, k)
+            for g, (_, alat) in enumerate(grup):
+                awal_optimal[alat] = (k, awal[g])
+        
+        for a, alat in alat_valid:
+            k, awal = awal_optimal[alat]
+            for j, (d, hari) in enumerate(hari_valid):
+                if awal[j] < 0:
+                    continue
+                if hari not in penggunaan_terjadwal:
+                    penggunaan_terjadwal[hari] = []
+                penggunaan_terjadwal[hari].extend(
+                    (self.jam[h], float(self.konsumsi[a, d, h]), alat)
+                    for h in range(awal[j], awal[j] + k)
+                )
+                if terisi is not None:
+                    terisi[a, d] |= int(BOBOT_BIT_JAM[awal[j]:awal[j] + k].sum())
+            
+        return penggunaan_terjadwal
+    
+    def opsi_tambahan(self, peralatan: List[str], terisi: Optional[np.ndarray] = None
+                      ) -> Tuple[List[Tuple[str, str, float, float, str]], np.ndarray, np.ndarray]:
+        """Mengumpulkan semua opsi penggunaan tambahan (hari, jam, konsumsi, biaya, alat) beserta array biaya dan konsumsinya.
+
+        Jam yang bitnya menyala di `terisi` (lihat `tahap_tetap`) tidak dijadikan opsi.
+        """
+        semua_opsi = []
+        for a, alat in self.kode_dari(peralatan):
+            for d, hari in enumerate(self.hari):
+                bebas = int(self.mask_tersedia[a, d])
+                if terisi is not None:
+                    bebas &= ~int(terisi[a, d])
+                for h in range(24):
+                    if not bebas >> h & 1:
+                        continue
+                    jam, konsumsi = self.jam[h], float(self.konsumsi[a, d, h])
+                    biaya = konsumsi * self.harga_per_kwh
+                    semua_opsi.append((hari, jam, konsumsi, biaya, alat))
+        
+        biaya_opsi = np.array([opsi[3] for opsi in semua_opsi], dtype=np.float64)
+        konsumsi_opsi = np.array([opsi[2] for opsi in semua_opsi], dtype=np.float64)
+        return semua_opsi, biaya_opsi, konsumsi_opsi
+
+    def kelompokkan_tambahan(self, semua_opsi: List[Tuple[str, str, float, float, str]],
+                             terpilih: np.ndarray) -> Dict[str, List[Tuple[str, float, str]]]:
+        """Mengelompokkan opsi terpilih per hari, urut menurut jam."""
+        penggunaan_tambahan = {}
+        for i in terpilih:
+            hari, jam, konsumsi, biaya, alat = semua_opsi[i]
+            if hari not in penggunaan_tambahan:
+                penggunaan_tambahan[hari] = []
+            penggunaan_tambahan[hari].append((jam, konsumsi, alat))
+        for hari in penggunaan_tambahan:
+            penggunaan_tambahan[hari].sort(key=lambda x: x[0])
+        return penggunaan_tambahan
+
+    def tambahan_greedy(self, peralatan: List[str], anggaran: float, terisi: Optional[np.ndarray] = None
+                        ) -> Tuple[Dict[str, List[Tuple[str, float, str]]], float]:
+        """Greedy konsumsi-terkecil dengan k-way merge malas atas indeks jam per peralatan yang sudah terurut.
+
+        Sama dengan `knapsack_greedy` atas `opsi_tambahan` (urutan ambil dan seri identik), tetapi hanya
+        O(k log m) untuk k item yang diambil dari m peralatan: karena biaya sebanding dengan konsumsi,
+        begitu item berikutnya tidak muat, semua item sesudahnya juga tidak muat. Jam terpilih langsung
+        dikelompokkan per hari dalam ember jam, jadi tidak perlu diurutkan ulang. Jam di `terisi`
+        dilewati dengan satu cek bit per item. Mengembalikan (penggunaan_tambahan, total kWh).
+        """
+        def aliran(a: int, alat: str):
+            konsumsi_urut, slot_urut = self.urutan_konsumsi[a]
+            if terisi is None:
+                return ((konsumsi, slot, alat) for konsumsi, slot in zip(konsumsi_urut, slot_urut))
+            terisi_alat = terisi[a].tolist()
+            return ((konsumsi, slot, alat) for konsumsi, slot in zip(konsumsi_urut, slot_urut)
+                    if not terisi_alat[slot // 24] >> slot % 24 & 1)
+
+        ember_hari = {}  # hari -> 24 ember jam, urutan kunci = urutan hari pertama kali dipilih
+        total_biaya, total_konsumsi = 0.0, 0.0
+        for konsumsi, slot, alat in heapq.merge(*(aliran(a, alat) for a, alat in self.kode_dari(peralatan)),
+                                                 key=lambda item: item[0]):
+            biaya = konsumsi * self.harga_per_kwh
+            if total_biaya + biaya > anggaran:
+                break
+            total_biaya += biaya
+            total_konsumsi += konsumsi
+            d, h = divmod(slot, 24)
+            if d not in ember_hari:
+                ember_hari[d] = [[] for _ in range(24)]
+            ember_hari[d][h].append((self.jam[h], konsumsi, alat))
+
+        penggunaan_tambahan = {
+            self.hari[d]: [item for ember_jam in ember for item in ember_jam] for d, ember in ember_hari.items()
+        }
+        return penggunaan_tambahan, total_konsumsi
+
+    def selesaikan_greedy(self, peralatan: List[str], anggaran: float, terisi: Optional[np.ndarray] = None
+                          ) -> Tuple[Dict[str, List[Tuple[str, float, str]]], Dict]:
+        """Tahap tambahan greedy lewat `tambahan_greedy`; mengembalikan (penggunaan_tambahan, info_tambahan).
+
+        Kunci info sama dengan solver lain; batas kerugian dari relaksasi LP.
+        """
+        penggunaan_tambahan, total_konsumsi = self.tambahan_greedy(peralatan, anggaran, terisi)
+        # Rasio kWh/biaya sama untuk semua item, jadi batas LP = min(semua kWh, anggaran / tarif)
+        kode_alat = [a for a, _ in self.kode_dari(peralatan)]
+        bebas = self.tersedia[kode_alat]
+        if terisi is not None:
+            bebas = bebas & ~jam_dari_bit(terisi[kode_alat])
+        semua_konsumsi = float(np.where(bebas, self.konsumsi[kode_alat], 0.0).sum())
+        batas_atas = min(semua_konsumsi, max(anggaran, 0.0) / self.harga_per_kwh)
+        info_tambahan = {
+            'solver': 'greedy',
+            'satuan_biaya': None,
+            'kerugian_maks_kwh': max(batas_atas, total_konsumsi) - total_konsumsi,
+            'perkiraan': None,
+            'dibatasi_memori': False,
+        }
+        return penggunaan_tambahan, info_tambahan
+
+    def temukan_penggunaan_tambahan(self, peralatan: List[str], batas_anggaran: float, 
+                                biaya_prioritas: float, biaya_terjadwal: float,
+                                satuan_biaya: float = 1, epsilon: Optional[float] = None,
+                                solver: str = "dp", target_latensi: float = 0.5,
+                                kemajuan: Optional[Kemajuan] = None,
+                                terisi: Optional[np.ndarray] = None) -> Dict[str, List[Tuple[str, float, str]]]:
+        """Menemukan penggunaan tambahan optimal dengan strategi knapsack `solver` untuk berbagai peralatan.
+
+        `solver` adalah nama di registry `knapsack.SOLVER` ("dp", "greedy", "pareto", "bnb") atau "auto",
+        yang memilih strategi dari perkiraan ukuran tabel DP, `target_latensi` (detik), dan celah greedy
+        (lihat `knapsack.pilih_solver`). Biaya DP dikuantisasi ke `satuan_biaya` rupiah (atau otomatis
+        dari `epsilon`). Solver yang dipakai, satuan, dan batas kerugian kWh disimpan di
+        `self.info_tambahan`. `kemajuan` diteruskan ke solver (lihat `knapsack.Kemajuan`) untuk laporan
+        kemajuan dan pembatalan. Jam yang sudah ditagih tahap sebelumnya (`terisi`, lihat `tahap_tetap`)
+        dikeluarkan sebelum knapsack.
+        """
+        mulai = time.time()
+        anggaran_sisa = batas_anggaran - (biaya_prioritas + biaya_terjadwal)
+        if solver == "greedy":
+            penggunaan_tambahan, self.info_tambahan = self.selesaikan_greedy(peralatan, anggaran_sisa, terisi)
+            if kemajuan is not None:
+                kemajuan(1.0)
+            print(f"Waktu Eksekusi greedy: {time.time() - mulai:.4f} detik")
+            return penggunaan_tambahan
+
+        semua_opsi, biaya_opsi, konsumsi_opsi = self.opsi_tambahan(peralatan, terisi)
+        hasil = selesaikan_knapsack(solver, biaya_opsi, konsumsi_opsi, anggaran_sisa,
+                                    satuan_biaya, epsilon, target_latensi, kemajuan, self.batas_memori_dp)
+        self.info_tambahan = {
+            'solver': hasil['solver'],
+            'satuan_biaya': hasil['satuan'],
+            'kerugian_maks_kwh': hasil['kerugian_maks'],
+            'perkiraan': hasil.get('perkiraan'),
+            'dibatasi_memori': hasil.get('dibatasi_memori', False),
+        }
+        penggunaan_tambahan = self.kelompokkan_tambahan(semua_opsi, hasil['terpilih'])
+        selesai = time.time()
+        print(f"Waktu Eksekusi {hasil['solver']}: {selesai - mulai:.4f} detik")
+        return penggunaan_tambahan
+
+    
+    def tahap_tetap(self, peralatan_prioritas: List[str], prioritas_mulai: int, prioritas_selesai: int,
+                    peralatan_terjadwal: List[str], hari_terjadwal: List[str],
+                    jam_dibutuhkan: Union[int, Dict[str, int]] = 2, jumlah_jalan: Union[int, Dict[str, int]] = 1,
+                    lintas_hari: bool = False) -> Tuple[Dict, float, Dict, float, np.ndarray]:
+        """Menjalankan tahap prioritas dan terjadwal (tidak bergantung anggaran) beserta biayanya.
+
+        Elemen terakhir adalah bitmask jam terisi berbentuk (peralatan, hari) (bit h = jam h) yang diisi
+        setiap tahap secara berurutan: jam prioritas, lalu jam terjadwal yang dipilih di luar jam prioritas
+        peralatan yang sama. Tahap tambahan memakainya untuk melewati jam yang sudah ditagih.
+        """
+        terisi = np.zeros((len(self.peralatan), len(self.hari)), dtype=np.int64)
+        penggunaan_prioritas = self.hitung_penggunaan_prioritas(peralatan_prioritas, prioritas_mulai, prioritas_selesai,
+                                                                terisi)
+        biaya_prioritas = sum(pemakaian[0] * self.harga_per_kwh for pemakaian in penggunaan_prioritas.values())
+        
+        penggunaan_terjadwal = self.temukan_penggunaan_terjadwal(
+            peralatan_terjadwal, hari_terjadwal, jam_dibutuhkan, jumlah_jalan, lintas_hari, terisi
+        )
+        biaya_terjadwal = sum(
+            sum(konsumsi for _, konsumsi, _ in jam)
+            for jam in penggunaan_terjadwal.values()
+        ) * self.harga_per_kwh
+        return penggunaan_prioritas, biaya_prioritas, penggunaan_terjadwal, biaya_terjadwal, terisi
+
+    def normalkan_daftar(self, peralatan_prioritas: List[str], peralatan_terjadwal: List[str],
+                         peralatan_tambahan: List[str], hari_terjadwal: List[str]
+                         ) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """Membuang nama berulang lalu mengurutkan daftar peralatan (nama) dan hari (urutan minggu).
+
+        Urutan input tidak berpengaruh, dan nama yang muncul dua kali (mis. "AC" dan "Ac" yang sama-sama
+        diterjemahkan ke HVAC) tidak membuat jam yang sama ditagih dua kali.
+        """
+        return (
+            sorted(set(peralatan_prioritas)), sorted(set(peralatan_terjadwal)), sorted(set(peralatan_tambahan)),
+            sorted(set(hari_terjadwal), key=lambda hari: self.kode_hari.get(hari, len(self.hari)))
+        )
+
+    def optimalkan_jadwal(self, peralatan_prioritas: List[str], prioritas_mulai: int, prioritas_selesai: int,
+                          peralatan_terjadwal: List[str], hari_terjadwal: List[str],
+                          peralatan_tambahan: List[str], anggaran_bulanan: float,
+                          satuan_biaya: float = 1, epsilon: Optional[float] = None, solver: str = "dp",
+                          target_latensi: float = 0.5, jam_dibutuhkan: Union[int, Dict[str, int]] = 2,
+                          jumlah_jalan: Union[int, Dict[str, int]] = 1, lintas_hari: bool = False,
+                          pakai_cache: bool = True, kemajuan: Optional[Kemajuan] = None) -> Dict:
+        """Menyusun jadwal lengkap; hasil disimpan di `cache_hasil` (LRU) dan, bila dipasang,
+        `cache_persisten` (SQLite) kecuali `pakai_cache=False`.
+
+        Daftar peralatan dan hari dinormalisasi (tanpa duplikat, diurutkan) sehingga urutan input dan
+        nama berulang tidak memengaruhi hasil maupun kunci cache. Hasil dari cache dibagikan antar
+        pemanggil, jadi jangan diubah.
+        `kemajuan` menerima kemajuan tahap knapsack (0..1); `PerhitunganDibatalkan` yang dilempar dari
+        callback itu menghentikan perhitungan tanpa mengisi cache.
+        """
+        peralatan_prioritas, peralatan_terjadwal, peralatan_tambahan, hari_terjadwal = self.normalkan_daftar(
+            peralatan_prioritas, peralatan_terjadwal, peralatan_tambahan, hari_terjadwal
+        )
+        kunci = (
+            self.sidik_data, self.harga_per_kwh, self.batas_memori_dp,
+            tuple(peralatan_prioritas), prioritas_mulai, prioritas_selesai,
+            tuple(peralatan_terjadwal), tuple(hari_terjadwal), tuple(peralatan_tambahan), anggaran_bulanan,
+            satuan_biaya, epsilon, solver, target_latensi,
+            kunci_opsi(jam_dibutuhkan), kunci_opsi(jumlah_jalan), lintas_hari,
+        )
+        if pakai_cache:
+            hasil = self.cache_hasil.ambil(kunci)
+            if hasil is None and self.cache_persisten is not None:
+                hasil = self.cache_persisten.ambil(kunci, self.sidik_data)
+                if hasil is not None:
+                    self.cache_hasil.simpan(kunci, hasil)
+            if hasil is not None:
+                self.info_tambahan = dict(hasil['info_tambahan'])
+                return hasil
+
+        penggunaan_prioritas, biaya_prioritas, penggunaan_terjadwal, biaya_terjadwal, terisi = self.tahap_tetap(
+            peralatan_prioritas, prioritas_mulai, prioritas_selesai, peralatan_terjadwal, hari_terjadwal,
+            jam_dibutuhkan, jumlah_jalan, lintas_hari
+        )
+        
+        penggunaan_tambahan = self.temukan_penggunaan_tambahan(
+            peralatan_tambahan, anggaran_bulanan, biaya_prioritas, biaya_terjadwal,
+            satuan_biaya, epsilon, solver, target_latensi, kemajuan, terisi
+        )
+        
+        hasil = {
+            'penggunaan_prioritas': penggunaan_prioritas,
+            'penggunaan_terjadwal': penggunaan_terjadwal,
+            'penggunaan_tambahan': penggunaan_tambahan,
+            'info_tambahan': dict(self.info_tambahan),
+            'total_biaya': biaya_prioritas + biaya_terjadwal + sum(
+                sum(konsumsi for _, konsumsi, _ in jam)
+                for jam in penggunaan_tambahan.values()
+            ) * self.harga_per_kwh
+        }
+        if pakai_cache:
+            self.cache_hasil.simpan(kunci, hasil)
+            if self.cache_persisten is not None:
+                self.cache_persisten.simpan(kunci, self.sidik_data, hasil)
+        return hasil
+    
+    def perkiraan_jadwal(self, peralatan_prioritas: List[str], prioritas_mulai: int, prioritas_selesai: int,
+                         peralatan_terjadwal: List[str], hari_terjadwal: List[str],
+                         peralatan_tambahan: List[str], anggaran_bulanan: float,
+                         satuan_biaya: float = 1, epsilon: Optional[float] = None, solver: str = "dp",
+                         target_latensi: float = 0.5, jam_dibutuhkan: Union[int, Dict[str, int]] = 2,
+                         jumlah_jalan: Union[int, Dict[str, int]] = 1, lintas_hari: bool = False) -> Dict:
+        """Memperkirakan waktu dan memori tahap knapsack `optimalkan_jadwal` tanpa menjalankannya.
+
+        Mengembalikan dict berisi 'solver' dan 'satuan_biaya' yang akan dipakai (setelah kebijakan
+        "auto" dan batas memori), 'dibatasi_memori', 'jumlah_item', 'anggaran_sisa', serta
+        'perkiraan' dari `knapsack.perkiraan_dp` (None bila solver tidak memakai tabel DP).
+        """
+        _, biaya_prioritas, _, biaya_terjadwal, terisi = self.tahap_tetap(
+            peralatan_prioritas, prioritas_mulai, prioritas_selesai, peralatan_terjadwal, hari_terjadwal,
+            jam_dibutuhkan, jumlah_jalan, lintas_hari
+        )
+        anggaran_sisa = anggaran_bulanan - (biaya_prioritas + biaya_terjadwal)
+        _, biaya_opsi, konsumsi_opsi = self.opsi_tambahan(peralatan_tambahan, terisi)
+        rencana = rencana_solver(solver, biaya_opsi, konsumsi_opsi, anggaran_sisa, satuan_biaya, epsilon,
+                                 target_latensi, self.batas_memori_dp)
+        return {
+            'solver': rencana['solver'],
+            'satuan_biaya': rencana['satuan_biaya'],
+            'dibatasi_memori': rencana['dibatasi_memori'],
+            'jumlah_item': len(biaya_opsi),
+            'anggaran_sisa': anggaran_sisa,
+            'perkiraan': rencana['perkiraan'],
+        }
+
+    def optimalkan_jadwal_sweep(self, peralatan_prioritas: List[str], prioritas_mulai: int, prioritas_selesai: int,
+                                peralatan_terjadwal: List[str], hari_terjadwal: List[str],
+                                peralatan_tambahan: List[str], daftar_anggaran: List[float],
+                                satuan_biaya: float = 1, jam_dibutuhkan: Union[int, Dict[str, int]] = 2,
+                                jumlah_jalan: Union[int, Dict[str, int]] = 1, lintas_hari: bool = False) -> Dict:
+        """Mengoptimalkan jadwal untuk banyak anggaran bulanan sekaligus dengan satu kali pengisian DP.
+
+        Mengembalikan dict berisi 'jadwal' (satu hasil seperti `optimalkan_jadwal` per anggaran, urutan
+        sama dengan `daftar_anggaran`) dan 'kurva' dengan 'anggaran' (Rp, total bulanan) serta
+        'energi_kwh' (total kWh terbaik) untuk setiap anggaran dari biaya tetap sampai anggaran terbesar.
+        """
+        mulai = time.time()
+        penggunaan_prioritas, biaya_prioritas, penggunaan_terjadwal, biaya_terjadwal, terisi = self.tahap_tetap(
+            peralatan_prioritas, prioritas_mulai, prioritas_selesai, peralatan_terjadwal, hari_terjadwal,
+            jam_dibutuhkan, jumlah_jalan, lintas_hari
+        )
+        biaya_tetap = biaya_prioritas + biaya_terjadwal
+        semua_opsi, biaya_opsi, konsumsi_opsi = self.opsi_tambahan(peralatan_tambahan, terisi)
+        sweep = knapsack_sweep(biaya_opsi, konsumsi_opsi, [anggaran - biaya_tetap for anggaran in daftar_anggaran],
+                               satuan_biaya, self.batas_memori_dp)
+
+        daftar_jadwal = []
+        for hasil in sweep['hasil']:
+            hasil.setdefault('solver', 'dp')
+            daftar_jadwal.append(self.susun_jadwal(
+                penggunaan_prioritas, penggunaan_terjadwal, biaya_tetap, semua_opsi, biaya_opsi, hasil
+            ))
+
+        energi_tetap = biaya_tetap / self.harga_per_kwh
+        selesai = time.time()
+        print(f"Waktu Eksekusi sweep {len(daftar_anggaran)} anggaran: {selesai - mulai:.4f} detik")
+        return {
+            'jadwal': daftar_jadwal,
+            'kurva': {
+                'anggaran': sweep['kurva_anggaran'] + biaya_tetap,
+                'energi_kwh': sweep['kurva_nilai'] + energi_tetap,
+            },
+        }
+    
+    def optimalkan_jadwal_anytime(self, peralatan_prioritas: List[str], prioritas_mulai: int, prioritas_selesai: int,
+                                  peralatan_terjadwal: List[str], hari_terjadwal: List[str],
+                                  peralatan_tambahan: List[str], anggaran_bulanan: float, batas_waktu: float = 1.0,
+                                  satuan_biaya: float = 1, jam_dibutuhkan: Union[int, Dict[str, int]] = 2,
+                                  jumlah_jalan: Union[int, Dict[str, int]] = 1, lintas_hari: bool = False) -> Iterator[Dict]:
+        """Yield jadwal (format `optimalkan_jadwal`) yang makin baik dalam `batas_waktu` detik.
+
+        Jadwal pertama berasal dari greedy dan langsung tersedia; berikutnya dari `knapsack_anytime`.
+        'info_tambahan' berisi juga 'tahap' (strategi penemu) dan 'waktu' (detik sejak mulai);
+        'kerugian_maks_kwh' adalah celah terbukti terhadap optimum.
+        """
+        penggunaan_prioritas, biaya_prioritas, penggunaan_terjadwal, biaya_terjadwal, terisi = self.tahap_tetap(
+            peralatan_prioritas, prioritas_mulai, prioritas_selesai, peralatan_terjadwal, hari_terjadwal,
+            jam_dibutuhkan, jumlah_jalan, lintas_hari
+        )
+        biaya_tetap = biaya_prioritas + biaya_terjadwal
+        semua_opsi, biaya_opsi, konsumsi_opsi = self.opsi_tambahan(peralatan_tambahan, terisi)
+        for hasil in knapsack_anytime(biaya_opsi, konsumsi_opsi, anggaran_bulanan - biaya_tetap, batas_waktu,
+                                      satuan_biaya, batas_memori=self.batas_memori_dp):
+            jadwal = self.susun_jadwal(penggunaan_prioritas, penggunaan_terjadwal, biaya_tetap,
+                                       semua_opsi, biaya_opsi, hasil)
+            jadwal['info_tambahan'].update(tahap=hasil['tahap'], waktu=hasil['waktu'])
+            yield jadwal
+
+    def susun_jadwal(self, penggunaan_prioritas: Dict, penggunaan_terjadwal: Dict, biaya_tetap: float,
+                     semua_opsi: List[Tuple[str, str, float, float, str]], biaya_opsi: np.ndarray, hasil: Dict) -> Dict:
+        """Menyusun dict jadwal (format `optimalkan_jadwal`) dari tahap tetap dan hasil knapsack."""
+        return {
+            'penggunaan_prioritas': penggunaan_prioritas,
+            'penggunaan_terjadwal': penggunaan_terjadwal,
+            'penggunaan_tambahan': self.kelompokkan_tambahan(semua_opsi, hasil['terpilih']),
+            'info_tambahan': {
+                'solver': hasil['solver'],
+                'satuan_biaya': hasil['satuan'],
+                'kerugian_maks_kwh': hasil['kerugian_maks'],
+                'perkiraan': hasil.get('perkiraan'),
+                'dibatasi_memori': hasil.get('dibatasi_memori', False),
+            },
+            'total_biaya': biaya_tetap + float(biaya_opsi[hasil['terpilih']].sum()),
+        }
+
+    def optimalkan_banyak(self, daftar_permintaan: List[Dict]) -> List[Dict]:
+        """Mengoptimalkan jadwal banyak rumah tangga terhadap indeks profil yang sama.
+
+        Setiap permintaan berisi argumen `optimalkan_jadwal` (nama parameter sebagai kunci). Permintaan
+        dengan tahap prioritas dan terjadwal yang sama dikelompokkan sehingga tahap itu dihitung sekali;
+        di dalamnya, permintaan dengan peralatan tambahan yang sama yang direncanakan `rencana_solver`
+        sebagai DP pada satuan biaya yang sama diselesaikan dengan satu `knapsack_sweep`. Karena satuan
+        dan 'perkiraan' ditentukan per permintaan, hasilnya sama dengan panggilan `optimalkan_jadwal`
+        tunggal, apa pun isi batch-nya. Hasil berurutan sesuai `daftar_permintaan`; dict tahap tetap
+        dibagikan antar hasil dalam satu grup, jadi jangan diubah.
+        """
+        mulai = time.time()
+        hasil_semua = [None] * len(daftar_permintaan)
+
+        grup = {}
+        for i, permintaan in enumerate(daftar_permintaan):
+            p = {**BAWAAN_PERMINTAAN, **permintaan}
+            # Dinormalisasi seperti `optimalkan_jadwal` agar pengelompokan dan hasil sama dengan panggilan tunggal
+            p['peralatan_prioritas'], p['peralatan_terjadwal'], p['peralatan_tambahan'], p['hari_terjadwal'] = \
+                self.normalkan_daftar(p['peralatan_prioritas'], p['peralatan_terjadwal'],
+                                      p['peralatan_tambahan'], p['hari_terjadwal'])
+            kunci_tetap = (
+                tuple(p['peralatan_prioritas']), p['prioritas_mulai'], p['prioritas_selesai'],
+                tuple(p['peralatan_terjadwal']), tuple(p['hari_terjadwal']),
+                kunci_opsi(p['jam_dibutuhkan']), kunci_opsi(p['jumlah_jalan']), p['lintas_hari'],
+            )
+            grup.setdefault(kunci_tetap, []).append((i, p))
+
+        for anggota in grup.values():
+            p0 = anggota[0][1]
+            penggunaan_prioritas, biaya_prioritas, penggunaan_terjadwal, biaya_terjadwal, terisi = self.tahap_tetap(
+                p0['peralatan_prioritas'], p0['prioritas_mulai'], p0['prioritas_selesai'],
+                p0['peralatan_terjadwal'], p0['hari_terjadwal'],
+                p0['jam_dibutuhkan'], p0['jumlah_jalan'], p0['lintas_hari']
+            )
+            biaya_tetap = biaya_prioritas + biaya_terjadwal
+
+            sub_grup = {}
+            for i, p in anggota:
+                kunci_tambahan = (tuple(p['peralatan_tambahan']), p['solver'], p['satuan_biaya'],
+                                  p['epsilon'], p['target_latensi'])
+                sub_grup.setdefault(kunci_tambahan, []).append((i, p))
+
+            for (peralatan_tambahan, solver, satuan_biaya, epsilon, target_latensi), daftar in sub_grup.items():
+                if solver == "greedy":
+                    # Greedy malas tanpa daftar opsi penuh, seperti `temukan_penggunaan_tambahan`
+                    for i, p in daftar:
+                        penggunaan_tambahan, info_tambahan = self.selesaikan_greedy(
+                            list(peralatan_tambahan), p['anggaran_bulanan'] - biaya_tetap, terisi
+                        )
+                        hasil_semua[i] = {
+                            'penggunaan_prioritas': penggunaan_prioritas,
+                            'penggunaan_terjadwal': penggunaan_terjadwal,
+                            'penggunaan_tambahan': penggunaan_tambahan,
+                            'info_tambahan': info_tambahan,
+                            'total_biaya': biaya_tetap + sum(
+                                sum(konsumsi for _, konsumsi, _ in jam)
+                                for jam in penggunaan_tambahan.values()
+                            ) * self.harga_per_kwh,
+                        }
+                    continue
+                semua_opsi, biaya_opsi, konsumsi_opsi = self.opsi_tambahan(list(peralatan_tambahan), terisi)
+
+                # Rencana per permintaan; hanya DP dengan satuan yang sama yang berbagi satu sweep
+                per_satuan = {}
+                for i, p in daftar:
+                    anggaran_sisa = p['anggaran_bulanan'] - biaya_tetap
+                    rencana = rencana_solver(solver, biaya_opsi, konsumsi_opsi, anggaran_sisa, satuan_biaya, epsilon,
+                                             target_latensi, self.batas_memori_dp)
+                    if rencana['solver'] == "dp":
+                        per_satuan.setdefault(rencana['satuan_biaya'], []).append((i, anggaran_sisa, rencana))
+                    else:
+                        per_satuan.setdefault(None, []).append((i, anggaran_sisa, rencana))
+
+                for satuan, anggota_satuan in per_satuan.items():
+                    if satuan is not None and len(anggota_satuan) > 1:
+                        sweep = knapsack_sweep(biaya_opsi, konsumsi_opsi, [a for _, a, _ in anggota_satuan], satuan,
+                                               self.batas_memori_dp)
+                        daftar_hasil = []
+                        for hasil, (_, anggaran_sisa, rencana) in zip(sweep['hasil'], anggota_satuan):
+                            hasil.update(solver='dp', perkiraan=rencana['perkiraan'],
+                                         dibatasi_memori=rencana['dibatasi_memori'])
+                            # Satuan lebih kasar dari yang diminta: sama seperti `selesaikan_knapsack`
+                            if satuan != satuan_biaya:
+                                hasil = bandingkan_greedy(hasil, biaya_opsi, konsumsi_opsi, anggaran_sisa)
+                            daftar_hasil.append(hasil)
+                    else:
+                        daftar_hasil = [
+                            selesaikan_knapsack(solver, biaya_opsi, konsumsi_opsi, anggaran_sisa, satuan_biaya,
+                                                epsilon, target_latensi, batas_memori=self.batas_memori_dp)
+                            for _, anggaran_sisa, _ in anggota_satuan
+                        ]
+                    for (i, _, _), hasil in zip(anggota_satuan, daftar_hasil):
+                        hasil_semua[i] = self.susun_jadwal(
+                            penggunaan_prioritas, penggunaan_terjadwal, biaya_tetap, semua_opsi, biaya_opsi, hasil
+                        )
+
+        selesai = time.time()
+        print(f"Waktu Eksekusi batch {len(daftar_permintaan)} permintaan ({len(grup)} grup): {selesai - mulai:.4f} detik")
+        return hasil_semua
+
+    def format_jadwal(self, jadwal: Dict, anggaran_bulanan: float) -> str:
+        """Format jadwal menjadi string yang mudah dibaca sesuai format yang diinginkan"""
+        output = []
+
+        for hari in self.hari:
+            output.append(f"\n{hari}:")
+            
+            # Penggunaan Prioritas
+            if hari in jadwal['penggunaan_prioritas']:
+                penggunaan, mask_jam, alat = jadwal['penggunaan_prioritas'][hari]
+                jam_terpakai = self.jam_dari_mask(mask_jam)
+                if jam_terpakai:
+                    alat_str = ', '.join(set(alat))  # Pastikan tidak ada alat yang terduplikasi
+                    # Memecah jam terpakai setiap 5 elemen per baris
+                    jam_terformat = []
+                    for i in range(0, len(jam_terpakai), 5):
+                        jam_terformat.append(", ".join(jam_terpakai[i:i + 5]))
+                    # Tambahkan indentasi ekstra untuk setiap baris baru
+                    jam_str = "\n            ".join(jam_terformat)
+                    output.append(f"-> Penggunaan Prioritas: {alat_str}")
+                    output.append(f"    Total Energi: {penggunaan:.2f} kWh")
+                    output.append(f"    Jam: {jam_str}")
+
+            # Penggunaan Terjadwal
+            if hari in jadwal['penggunaan_terjadwal']:
+                jam_terjadwal = jadwal['penggunaan_terjadwal'][hari]
+                if jam_terjadwal:
+                    total_terjadwal = sum(konsumsi for _, konsumsi, _ in jam_terjadwal)
+                    output.append(f"-> Penggunaan Terjadwal: {total_terjadwal:.2f} kWh")
+                    for waktu, konsumsi, alat in jam_terjadwal:
+                        output.append(f"    {waktu} - {alat} ({konsumsi:.2f} kWh)")
+
+            # Penggunaan Tambahan
+            if hari in jadwal['penggunaan_tambahan']:
+                jam_tambahan = jadwal['penggunaan_tambahan'][hari]
+                if jam_tambahan:
+                    total_tambahan = sum(konsumsi for _, konsumsi, _ in jam_tambahan)
+                    output.append(f"-> Penggunaan Tambahan: {total_tambahan:.2f} kWh")
+                    for waktu, konsumsi, alat in jam_tambahan:
+                        output.append(f"    {waktu} - {alat} ({konsumsi:.2f} kWh)")
+
+        return "\n".join(output)
+
+
+@lru_cache(maxsize=None)
+def muat_penjadwal(path_csv: str = PATH_DATA, harga_per_kwh: float = 1400,
+                   path_cache: Optional[str] = None) -> PenjadwalDaya:
+    """Memuat dataset dan membangun PenjadwalDaya sekali per (path, tarif); panggilan berikutnya memakai ulang.
+
+    Tensor diambil lewat `muat_tensor` (cache biner di sebelah CSV). Dengan `path_cache`, hasil jadwal juga disimpan di file SQLite tersebut dan dipakai ulang antar proses.
+    """
+    penjadwal = PenjadwalDaya.dari_tensor(*muat_tensor(path_csv), harga_per_kwh)
+    if path_cache is not None:
+        penjadwal.cache_persisten = CacheSQLite(path_cache)
+    return penjadwal
+
+
+def optimalkan_banyak(daftar_permintaan: List[Dict], path_csv: str = PATH_DATA,
+                      harga_per_kwh: float = 1400) -> List[Dict]:
+    """Mengoptimalkan banyak permintaan rumah tangga terhadap satu indeks profil bersama."""
+    return muat_penjadwal(path_csv, harga_per_kwh).optimalkan_banyak(daftar_permintaan)
+
+
+# Penjadwal milik proses worker, dibangun sekali oleh `_inisialisasi_worker` dari shared memory
+_PENJADWAL_WORKER: Optional[PenjadwalDaya] = None
+_MEMORI_WORKER: List[shared_memory.SharedMemory] = []
+
+
+def _inisialisasi_worker(peralatan: List[str], nama_konsumsi: str, nama_tersedia: str,
+                         bentuk: Tuple[int, int, int], harga_per_kwh: float) -> None:
+    """Menempelkan tensor profil dari shared memory (tanpa salinan) dan membangun penjadwal worker."""
+    global _PENJADWAL_WORKER
+    memori_konsumsi = shared_memory.SharedMemory(name=nama_konsumsi)
+    memori_tersedia = shared_memory.SharedMemory(name=nama_tersedia)
+    _MEMORI_WORKER.extend([memori_konsumsi, memori_tersedia])  # Simpan referensi selama worker hidup
+    konsumsi = np.ndarray(bentuk, dtype=np.float64, buffer=memori_konsumsi.buf)
+    tersedia = np.ndarray(bentuk, dtype=bool, buffer=memori_tersedia.buf)
+    _PENJADWAL_WORKER = PenjadwalDaya.dari_tensor(peralatan, konsumsi, tersedia, harga_per_kwh)
+
+
+def _optimalkan_chunk(daftar_permintaan: List[Dict]) -> List[Dict]:
+    """Mengoptimalkan satu chunk permintaan di worker; cetakan waktu per chunk diredam."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return _PENJADWAL_WORKER.optimalkan_banyak(daftar_permintaan)
+
+
+def optimalkan_banyak_paralel(daftar_permintaan: List[Dict], path_csv: str = PATH_DATA,
+                              harga_per_kwh: float = 1400, jumlah_worker: Optional[int] = None,
+                              ukuran_chunk: int = 64) -> Iterator[Dict]:
+    """Seperti `optimalkan_banyak`, tetapi dibagi per chunk ke `ProcessPoolExecutor`.
+
+    Tensor profil ditaruh di shared memory sekali dan ditempelkan oleh setiap worker, bukan
+    di-pickle per tugas. Permintaan dikirim dalam chunk berurutan berisi `ukuran_chunk` permintaan
+    (pengelompokan tahap tetap berlaku di dalam chunk), dan hasil di-yield sesuai urutan
+    `daftar_permintaan` begitu chunk-nya selesai.
+    """
+    if ukuran_chunk <= 0:
+        raise ValueError("ukuran_chunk harus lebih besar dari 0")
+    penjadwal = muat_penjadwal(path_csv, harga_per_kwh)
+    memori_konsumsi = shared_memory.SharedMemory(create=True, size=max(penjadwal.konsumsi.nbytes, 1))
+    memori_tersedia = shared_memory.SharedMemory(create=True, size=max(penjadwal.tersedia.nbytes, 1))
+    try:
+        bentuk = penjadwal.konsumsi.shape
+        np.ndarray(bentuk, dtype=np.float64, buffer=memori_konsumsi.buf)[...] = penjadwal.konsumsi
+        np.ndarray(bentuk, dtype=bool, buffer=memori_tersedia.buf)[...] = penjadwal.tersedia
+
+        chunk = [daftar_permintaan[i:i + ukuran_chunk] for i in range(0, len(daftar_permintaan), ukuran_chunk)]
+        with ProcessPoolExecutor(
+            max_workers=jumlah_worker,
+            initializer=_inisialisasi_worker,
+            initargs=(penjadwal.peralatan, memori_konsumsi.name, memori_tersedia.name, bentuk, harga_per_kwh),
+        ) as executor:
+            for hasil_chunk in executor.map(_optimalkan_chunk, chunk):
+                yield from hasil_chunk
+    finally:
+        memori_konsumsi.close()
+        memori_konsumsi.unlink()
+        memori_tersedia.close()
+        memori_tersedia.unlink()
+
@@ -0,0 +1,83 @@
+"""Penyimpanan konsumsi per jam banyak rumah tangga di disk (memory-mapped) untuk PenjadwalDaya."""
+import datetime
+import json
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Nama file di dalam folder penyimpanan
+FILE_META = 'meta.json'
+FILE_KONSUMSI = 'konsumsi.npy'
+
+
+class PenyimpananRumahTangga:
+    """Array kWh float32 berbentuk (rumah, tanggal, peralatan, jam) di file `.npy` yang di-memory-map.
+
+    Sumbu rumah paling luar sehingga data satu rumah bersebelahan di disk: membaca profil satu rumah
+    hanya memuat halaman milik rumah itu. Jam tanpa pembacaan bernilai NaN. Label rumah, peralatan,
+    dan tanggal awal disimpan di `meta.json`.
+    """
+
+    def __init__(self, folder: str, mode: str = 'r'):
+        self.folder = folder
+        with open(os.path.join(folder, FILE_META), encoding='utf-8') as f:
+            meta = json.load(f)
+        self.rumah: List[str] = meta['rumah']
+        self.peralatan: List[str] = meta['peralatan']
+        self.tanggal_awal = datetime.date.fromisoformat(meta['tanggal_awal'])
+        self.kode_rumah = {rumah: i for i, rumah in enumerate(self.rumah)}
+        self.data = np.load(os.path.join(folder, FILE_KONSUMSI), mmap_mode=mode)
+
+    @classmethod
+    def buat(cls, folder: str, rumah: List[str], peralatan: List[str], tanggal_awal: datetime.date,
+             jumlah_hari: int) -> 'PenyimpananRumahTangga':
+        """Membuat penyimpanan kosong (semua NaN) lalu membukanya dalam mode baca-tulis."""
+        os.makedirs(folder, exist_ok=True)
+        data = np.lib.format.open_memmap(os.path.join(folder, FILE_KONSUMSI), mode='w+', dtype=np.float32,
+                                         shape=(len(rumah), jumlah_hari, len(peralatan), 24))
+        for r in range(len(rumah)):  # Diisi per rumah agar memori tetap terbatas
+            data[r] = np.nan
+        data.flush()
+        del data
+        with open(os.path.join(folder, FILE_META), 'w', encoding='utf-8') as f:
+            json.dump({'rumah': list(rumah), 'peralatan': list(peralatan),
+                       'tanggal_awal': tanggal_awal.isoformat()}, f)
+        return cls(folder, mode='r+')
+
+    def indeks_tanggal(self, tanggal: datetime.date) -> int:
+        """Mengubah tanggal menjadi indeks pada sumbu tanggal."""
+        return (tanggal - self.tanggal_awal).days
+
+    def tulis_hari(self, rumah: str, tanggal: datetime.date, konsumsi: np.ndarray) -> None:
+        """Menulis konsumsi satu hari (peralatan, jam) untuk satu rumah; NaN menandai jam tanpa data."""
+        self.data[self.kode_rumah[rumah], self.indeks_tanggal(tanggal)] = konsumsi
+
+    def profil(self, rumah: str, mulai: Optional[datetime.date] = None, akhir: Optional[datetime.date] = None,
+               ukuran_blok: int = 366) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Merata-ratakan data satu rumah per (peralatan, hari dalam minggu, jam) pada rentang [mulai, akhir).
+
+        Mengembalikan (peralatan, konsumsi, tersedia) dengan bentuk yang sama seperti `bangun_tensor_konsumsi`.
+        Tanggal dibaca per blok `ukuran_blok` hari sehingga memori tetap terbatas untuk rentang bertahun-tahun.
+        """
+        r = self.kode_rumah[rumah]
+        i0 = 0 if mulai is None else max(self.indeks_tanggal(mulai), 0)
+        i1 = self.data.shape[1] if akhir is None else min(self.indeks_tanggal(akhir), self.data.shape[1])
+        bentuk = (len(self.peralatan), 7, 24)
+        jumlah = np.zeros(bentuk, dtype=np.float64)
+        cacah = np.zeros(bentuk, dtype=np.int64)
+        hari_awal = self.tanggal_awal.weekday()
+
+        for b0 in range(i0, i1, ukuran_blok):
+            blok = np.asarray(self.data[r, b0:min(b0 + ukuran_blok, i1)], dtype=np.float64)
+            ada = ~np.isnan(blok)
+            nilai = np.where(ada, blok, 0.0)
+            for d in range(7):
+                # Baris blok yang jatuh pada hari d (Senin = 0)
+                geser = (d - hari_awal - b0) % 7
+                jumlah[:, d] += nilai[geser::7].sum(axis=0)
+                cacah[:, d] += ada[geser::7].sum(axis=0)
+
+        tersedia = cacah > 0
+        konsumsi = np.divide(jumlah, cacah, out=np.zeros(bentuk, dtype=np.float64), where=tersedia)
+        return list(self.peralatan), konsumsi, tersedia